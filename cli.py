@@ -3,27 +3,46 @@
 
 import argparse
 import sys
-import json
 import logging
-from typing import Optional, Dict, Any
+from typing import TYPE_CHECKING, Optional, Dict, Any
 
-from src.config import DatabricksConfig
-from src.services.databricks_service import DatabricksService
-from src.tools.query_tool import QueryTool
-from src.tools.table_compare_tool import TableCompareTool
+if TYPE_CHECKING:
+    import asyncio
+
+    from src.config import DatabricksConfig
+    from src.services.databricks_service import DatabricksService
+
+# Streaming output tuning
+FLUSH_INTERVAL_ROWS = 100  # Flush stdout every N rows
+
+# Log formats
+_FMT_SHORT = '%(levelname)s: %(message)s'
+_FMT_LONG = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+
+
+class _CLIContext:
+    """No-op stand-in for the FastMCP context in CLI usage."""
+
+    async def info(self, msg): pass
+    async def error(self, msg): pass
+
+
+_CLI_CTX = _CLIContext()
 
 
 def setup_logging(verbose: bool = False) -> None:
     """Configure logging for CLI."""
-    level = logging.DEBUG if verbose else logging.WARNING
     logging.basicConfig(
-        level=level,
-        format='%(levelname)s: %(message)s' if not verbose else '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+        level=logging.DEBUG if verbose else logging.WARNING,
+        format=_FMT_LONG if verbose else _FMT_SHORT,
+        force=True,
     )
 
 
-def load_config() -> Optional[DatabricksConfig]:
+def load_config() -> Optional["DatabricksConfig"]:
     """Load Databricks configuration."""
+    from src.config import DatabricksConfig
+
     try:
         return DatabricksConfig.load_from_env()
     except ValueError as e:
@@ -35,84 +54,141 @@ def load_config() -> Optional[DatabricksConfig]:
         return None
 
 
-def execute_query_cmd(args: argparse.Namespace, client: DatabricksService) -> int:
+def _dumps_for_stdout(obj: Any) -> str:
+    """Serialize to JSON for stdout: pretty on a TTY, compact when piped."""
+    import json
+
+    if sys.stdout.isatty():
+        return json.dumps(obj, indent=2, ensure_ascii=False)
+    return json.dumps(obj, separators=(',', ':'), ensure_ascii=False)
+
+
+def _write_json_result(result: Dict[str, Any]) -> None:
+    """Write a query result as JSON, streaming the data array row by row.
+
+    Avoids serializing the full rowset into one string before any output
+    is emitted, so large results can be piped incrementally. Streamed
+    output always uses compact separators.
+    """
+    import json
+
+    if 'data' not in result:
+        print(_dumps_for_stdout(result))
+        return
+
+    out = sys.stdout
+    out.write('{')
+    for key, value in result.items():
+        if key == 'data':
+            continue
+        out.write(f'{json.dumps(key)}:{json.dumps(value, separators=(",", ":"), ensure_ascii=False)},')
+    out.write('"data":[')
+    for i, row in enumerate(result['data']):
+        if i:
+            out.write(',')
+        out.write(json.dumps(row, separators=(',', ':'), ensure_ascii=False))
+        if (i + 1) % FLUSH_INTERVAL_ROWS == 0:
+            out.flush()
+    out.write(']}\n')
+    out.flush()
+
+
+def execute_query_cmd(
+    args: argparse.Namespace,
+    client: "DatabricksService",
+    loop: "asyncio.AbstractEventLoop",
+) -> int:
     """Execute SQL query command."""
+    from src.tools.query_tool import QueryTool
+
     tool = QueryTool(client)
-    
+
     try:
-        # Create a mock context for CLI usage
-        class MockContext:
-            async def info(self, msg): pass
-            async def error(self, msg): pass
-        
-        import asyncio
-        result = asyncio.run(tool.execute_query(MockContext(), query=args.query, limit=args.limit))
-        
+        result = loop.run_until_complete(
+            tool.execute_query(_CLI_CTX, query=args.query, limit=args.limit)
+        )
+
         if args.format == 'json':
-            print(json.dumps(result, indent=2))
+            _write_json_result(result)
         else:
             # Pretty print table format
             if not result.get('success', False):
                 print(f"Error: {result.get('error', 'Unknown error')}", file=sys.stderr)
                 return 1
-            
+
             columns = result.get('columns', [])
             rows = result.get('data', [])
-            
+
             if not rows:
                 print("No results returned.")
                 return 0
-            
-            # Calculate column widths
-            widths = [len(col) for col in columns]
-            for row in rows:
-                for i, col in enumerate(columns):
-                    cell_value = row.get(col, '')
-                    widths[i] = max(widths[i], len(str(cell_value)))
-            
-            # Print header
-            header = ' | '.join(col.ljust(widths[i]) for i, col in enumerate(columns))
-            print(header)
-            print('-' * len(header))
-            
-            # Print rows
-            for row in rows:
-                row_values = [str(row.get(col, '')) for col in columns]
-                print(' | '.join(val.ljust(widths[i]) for i, val in enumerate(row_values)))
-            
-            print(f"\nReturned {len(rows)} rows.")
-        
+
+            # The rowset is fully materialized before rendering starts, so
+            # exact widths cost one cheap pass per column and keep every
+            # row aligned; map/len keeps the max tracking at C level.
+            widths = [
+                max(len(col), *map(len, (str(row.get(col, '')) for row in rows)))
+                for col in columns
+            ]
+
+            import io
+
+            out = sys.stdout
+
+            # Precompile the row format so padding is dispatched in C
+            # instead of one ljust call per cell
+            row_fmt = ' | '.join('{:<%d}' % w for w in widths)
+
+            # Buffer rendered lines and write stdout in chunks so each
+            # row does not pay its own lock/encode/flush cycle
+            buf = io.StringIO()
+            header = row_fmt.format(*columns)
+            buf.write(header + '\n')
+            buf.write('-' * len(header) + '\n')
+
+            for n, row in enumerate(rows, 1):
+                buf.write(row_fmt.format(*(str(row.get(col, '')) for col in columns)) + '\n')
+                if n % FLUSH_INTERVAL_ROWS == 0:
+                    out.write(buf.getvalue())
+                    out.flush()
+                    buf.seek(0)
+                    buf.truncate()
+
+            buf.write(f"\nReturned {len(rows)} rows.\n")
+            out.write(buf.getvalue())
+            out.flush()
+
         return 0
     except Exception as e:
         print(f"Error executing query: {e}", file=sys.stderr)
         return 1
 
 
-def table_info_cmd(args: argparse.Namespace, client: DatabricksService) -> int:
+def table_info_cmd(
+    args: argparse.Namespace,
+    client: "DatabricksService",
+    loop: "asyncio.AbstractEventLoop",
+) -> int:
     """Get table information command."""
+    from src.tools.query_tool import QueryTool
+
     tool = QueryTool(client)
-    
+
     try:
-        # Create a mock context for CLI usage
-        class MockContext:
-            async def info(self, msg): pass
-            async def error(self, msg): pass
-        
-        import asyncio
-        result = asyncio.run(tool.get_table_info(
-            MockContext(),
+        result = loop.run_until_complete(tool.get_table_info(
+            _CLI_CTX,
             table_name=args.table,
             catalog=args.catalog,
             schema=args.schema
         ))
-        
+
         if args.format == 'json':
-            print(json.dumps(result, indent=2))
+            print(_dumps_for_stdout(result))
         else:
             if not result.get('success', False):
                 print(f"Error: {result.get('error', 'Unknown error')}", file=sys.stderr)
                 return 1
-            
+
             info = result['table_info']
             print(f"Table: {info['table_name']}")
             print(f"Row Count: {info['row_count']:,}")
@@ -127,20 +203,20 @@ def table_info_cmd(args: argparse.Namespace, client: DatabricksService) -> int:
         return 1
 
 
-def compare_tables_cmd(args: argparse.Namespace, client: DatabricksService) -> int:
+def compare_tables_cmd(
+    args: argparse.Namespace,
+    client: "DatabricksService",
+    loop: "asyncio.AbstractEventLoop",
+) -> int:
     """Compare tables command."""
+    from src.tools.table_compare_tool import TableCompareTool
+
     tool = TableCompareTool(client)
-    
+
     try:
-        # Create a mock context for CLI usage
-        class MockContext:
-            async def info(self, msg): pass
-            async def error(self, msg): pass
-        
-        import asyncio
         if args.quick:
-            result = asyncio.run(tool.quick_compare_tables(
-                MockContext(),
+            result = loop.run_until_complete(tool.quick_compare_tables(
+                _CLI_CTX,
                 table1=args.table1,
                 table2=args.table2,
                 catalog1=args.catalog1,
@@ -149,8 +225,8 @@ def compare_tables_cmd(args: argparse.Namespace, client: DatabricksService) -> i
                 schema2=args.schema2
             ))
         else:
-            result = asyncio.run(tool.compare_tables(
-                MockContext(),
+            result = loop.run_until_complete(tool.compare_tables(
+                _CLI_CTX,
                 table1=args.table1,
                 table2=args.table2,
                 catalog1=args.catalog1,
@@ -161,12 +237,12 @@ def compare_tables_cmd(args: argparse.Namespace, client: DatabricksService) -> i
             ))
         
         if args.format == 'json':
-            print(json.dumps(result, indent=2))
+            print(_dumps_for_stdout(result))
         else:
             if not result.get('success', False):
                 print(f"Error: {result.get('error', 'Unknown error')}", file=sys.stderr)
                 return 1
-            
+
             if args.quick:
                 print("Quick comparison results:")
                 print(f"Table 1 rows: {result['table1_info']['row_count']:,}")
@@ -184,34 +260,45 @@ def compare_tables_cmd(args: argparse.Namespace, client: DatabricksService) -> i
 
 def main() -> int:
     """Main CLI entry point."""
-    parser = argparse.ArgumentParser(description='Databricks CLI Tool')
+    parser = argparse.ArgumentParser(description='Databricks CLI Tool', allow_abbrev=False)
     parser.add_argument('-v', '--verbose', action='store_true', help='Enable verbose logging')
     parser.add_argument('--format', choices=['table', 'json'], default='table', help='Output format')
     
     subparsers = parser.add_subparsers(dest='command', help='Available commands')
-    
-    # Query command
-    query_parser = subparsers.add_parser('query', help='Execute SQL query')
-    query_parser.add_argument('query', help='SQL query to execute')
-    query_parser.add_argument('--limit', type=int, default=1000, help='Maximum rows to return')
-    
-    # Table info command
-    info_parser = subparsers.add_parser('info', help='Get table information')
-    info_parser.add_argument('table', help='Table name')
-    info_parser.add_argument('--catalog', help='Catalog name')
-    info_parser.add_argument('--schema', help='Schema name')
-    
-    # Compare tables command
-    compare_parser = subparsers.add_parser('compare', help='Compare two tables')
-    compare_parser.add_argument('table1', help='First table name')
-    compare_parser.add_argument('table2', help='Second table name')
-    compare_parser.add_argument('--catalog1', help='Catalog for first table')
-    compare_parser.add_argument('--schema1', help='Schema for first table')
-    compare_parser.add_argument('--catalog2', help='Catalog for second table')
-    compare_parser.add_argument('--schema2', help='Schema for second table')
-    compare_parser.add_argument('--diff-lines', type=int, default=10, help='Number of diff context lines')
-    compare_parser.add_argument('--quick', action='store_true', help='Quick metadata-only comparison')
-    
+
+    # Only construct the subparser actually being invoked; fall back to
+    # building all of them for --help, errors, or unknown commands
+    subcmd = (
+        sys.argv[1]
+        if len(sys.argv) > 1 and sys.argv[1] in ('query', 'info', 'compare')
+        else None
+    )
+
+    if subcmd in (None, 'query'):
+        query_parser = subparsers.add_parser('query', help='Execute SQL query')
+        query_parser.add_argument('query', help='SQL query to execute')
+        query_parser.add_argument('--limit', type=int, default=1000, help='Maximum rows to return')
+        query_parser.set_defaults(func=execute_query_cmd)
+
+    if subcmd in (None, 'info'):
+        info_parser = subparsers.add_parser('info', help='Get table information')
+        info_parser.add_argument('table', help='Table name')
+        info_parser.add_argument('--catalog', help='Catalog name')
+        info_parser.add_argument('--schema', help='Schema name')
+        info_parser.set_defaults(func=table_info_cmd)
+
+    if subcmd in (None, 'compare'):
+        compare_parser = subparsers.add_parser('compare', help='Compare two tables')
+        compare_parser.add_argument('table1', help='First table name')
+        compare_parser.add_argument('table2', help='Second table name')
+        compare_parser.add_argument('--catalog1', help='Catalog for first table')
+        compare_parser.add_argument('--schema1', help='Schema for first table')
+        compare_parser.add_argument('--catalog2', help='Catalog for second table')
+        compare_parser.add_argument('--schema2', help='Schema for second table')
+        compare_parser.add_argument('--diff-lines', type=int, default=10, help='Number of diff context lines')
+        compare_parser.add_argument('--quick', action='store_true', help='Quick metadata-only comparison')
+        compare_parser.set_defaults(func=compare_tables_cmd)
+
     args = parser.parse_args()
     
     if not args.command:
@@ -227,26 +314,25 @@ def main() -> int:
     
     # Initialize client
     try:
+        from src.services.databricks_service import DatabricksService
         client = DatabricksService(config)
         # Test connection would need to be implemented in DatabricksService
     except Exception as e:
         print(f"Error initializing Databricks client: {e}", file=sys.stderr)
         return 1
     
-    # Execute command
+    # Execute command on a single event loop shared by all handlers
+    import asyncio
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+
     try:
-        if args.command == 'query':
-            return execute_query_cmd(args, client)
-        elif args.command == 'info':
-            return table_info_cmd(args, client)
-        elif args.command == 'compare':
-            return compare_tables_cmd(args, client)
-        else:
-            print(f"Unknown command: {args.command}", file=sys.stderr)
-            return 1
+        return args.func(args, client, loop)
     except KeyboardInterrupt:
         print("\nOperation cancelled by user", file=sys.stderr)
         return 130
+    finally:
+        loop.close()
 
 
 if __name__ == '__main__':
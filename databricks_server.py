@@ -8,14 +8,18 @@ from src.config import DatabricksConfig
 
 logger = logging.getLogger(__name__)
 
+# Log format
+_LOG_FMT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+
 
 def setup_logging() -> None:
     """Configure logging for the application."""
     log_level = os.getenv('LOG_LEVEL', 'INFO').upper()
     logging.basicConfig(
         level=getattr(logging, log_level, logging.INFO),
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        handlers=[logging.StreamHandler(sys.stdout)]
+        format=_LOG_FMT,
+        handlers=[logging.StreamHandler(sys.stdout)],
+        force=True,
     )
 
 
@@ -28,14 +32,14 @@ def load_config() -> Optional[DatabricksConfig]:
     try:
         return DatabricksConfig.load_from_env()
     except ValueError as e:
-        logger.critical(f"Configuration error: {e}")
+        logger.critical("Configuration error: %s", e)
         logger.info("Please ensure the following environment variables are set:")
         logger.info("- DATABRICKS_SERVER_HOSTNAME")
         logger.info("- DATABRICKS_HTTP_PATH")
         logger.info("- DATABRICKS_ACCESS_TOKEN")
         return None
     except Exception as e:
-        logger.critical(f"Unexpected error loading configuration: {e}", exc_info=True)
+        logger.critical("Unexpected error loading configuration: %s", e, exc_info=True)
         return None
 
 
@@ -57,7 +61,7 @@ def initialize_server(config: DatabricksConfig) -> Optional[DatabricksMCPServer]
             logger.critical("Failed to initialize server")
             return None
     except Exception as e:
-        logger.critical(f"Server initialization failed: {e}", exc_info=True)
+        logger.critical("Server initialization failed: %s", e, exc_info=True)
         return None
 
 
@@ -89,7 +93,7 @@ def main() -> int:
         logger.info("Server stopped by user")
         return 0
     except Exception as e:
-        logger.critical(f"Server runtime error: {e}", exc_info=True)
+        logger.critical("Server runtime error: %s", e, exc_info=True)
         return 1
 
 
@@ -1,7 +1,19 @@
 """Databricks MCP Server."""
 
 from .config import DatabricksConfig
-from .server import DatabricksMCPServer
 
 __version__ = "1.0.0"
 __all__ = ["DatabricksConfig", "DatabricksMCPServer"]
+
+
+def __getattr__(name):
+    """Lazily re-export the server class (PEP 562).
+
+    Keeps ``import src`` cheap by deferring the fastmcp import chain
+    until DatabricksMCPServer is actually referenced.
+    """
+    if name == "DatabricksMCPServer":
+        from .server import DatabricksMCPServer
+
+        return DatabricksMCPServer
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
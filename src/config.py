@@ -3,9 +3,7 @@
 import logging
 import os
 from dataclasses import dataclass
-from typing import List
-
-from dotenv import load_dotenv
+from typing import ClassVar, List, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
@@ -13,6 +11,10 @@ logger = logging.getLogger(__name__)
 DEFAULT_CATALOG = "main"
 DEFAULT_SCHEMA = "default"
 DEFAULT_TEMP_DIR = "/tmp/databricks_mcp"
+DEFAULT_POOL_SIZE = 4
+
+# Supported CSV output compression codecs (None means uncompressed)
+CSV_COMPRESSION_OPTIONS = (None, "gzip", "zstd")
 
 # Environment variable names
 ENV_SERVER_HOSTNAME = "DATABRICKS_SERVER_HOSTNAME"
@@ -21,12 +23,29 @@ ENV_ACCESS_TOKEN = "DATABRICKS_ACCESS_TOKEN"
 ENV_CATALOG = "DATABRICKS_CATALOG"
 ENV_SCHEMA = "DATABRICKS_SCHEMA"
 ENV_TEMP_DIR = "DATABRICKS_TEMP_DIR"
+ENV_POOL_SIZE = "DATABRICKS_POOL_SIZE"
+ENV_CSV_COMPRESSION = "DATABRICKS_CSV_COMPRESSION"
 
 # Required environment variables
-REQUIRED_ENV_VARS = [ENV_SERVER_HOSTNAME, ENV_HTTP_PATH, ENV_ACCESS_TOKEN]
+REQUIRED_ENV_VARS = (ENV_SERVER_HOSTNAME, ENV_HTTP_PATH, ENV_ACCESS_TOKEN)
+
+# Dataclass field name -> environment variable
+ENV_VAR_BY_FIELD = {
+    "server_hostname": ENV_SERVER_HOSTNAME,
+    "http_path": ENV_HTTP_PATH,
+    "access_token": ENV_ACCESS_TOKEN,
+    "catalog": ENV_CATALOG,
+    "schema": ENV_SCHEMA,
+    "temp_dir": ENV_TEMP_DIR,
+    "pool_size": ENV_POOL_SIZE,
+    "csv_compression": ENV_CSV_COMPRESSION,
+}
 
+# Required dataclass fields (no default from the environment)
+REQUIRED_FIELDS = ("server_hostname", "http_path", "access_token")
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class DatabricksConfig:
     """Configuration for the Databricks MCP Server."""
 
@@ -36,48 +55,63 @@ class DatabricksConfig:
     catalog: str = DEFAULT_CATALOG
     schema: str = DEFAULT_SCHEMA
     temp_dir: str = DEFAULT_TEMP_DIR
+    pool_size: int = DEFAULT_POOL_SIZE
+    csv_compression: Optional[str] = None
+
+    # Cache of (env values, config) from the last successful load
+    _cache: ClassVar[Optional[Tuple[tuple, "DatabricksConfig"]]] = None
 
     @classmethod
     def load_from_env(cls) -> "DatabricksConfig":
         """Load configuration from environment variables or .env file.
 
+        Only parses the .env file when required variables are not already
+        set, and returns the cached instance when the environment has not
+        changed since the last load.
+
         Returns:
             DatabricksConfig instance
 
         Raises:
             ValueError: If required configuration is missing
         """
-        load_dotenv()
+        if not all(os.getenv(var) for var in REQUIRED_ENV_VARS):
+            from dotenv import load_dotenv
+
+            load_dotenv()
 
         # Get environment variables
         env_values = cls._get_environment_values()
 
+        # Reuse the cached config if the environment is unchanged
+        key = tuple(env_values.values())
+        if cls._cache is not None and cls._cache[0] == key:
+            return cls._cache[1]
+
         # Validate required values
         cls._validate_required_values(env_values)
 
-        return cls(
-            server_hostname=env_values[ENV_SERVER_HOSTNAME],
-            http_path=env_values[ENV_HTTP_PATH],
-            access_token=env_values[ENV_ACCESS_TOKEN],
-            catalog=env_values[ENV_CATALOG],
-            schema=env_values[ENV_SCHEMA],
-            temp_dir=env_values[ENV_TEMP_DIR],
-        )
+        config = cls(**env_values)
+        cls._cache = (key, config)
+        return config
 
     @classmethod
     def _get_environment_values(cls) -> dict:
         """Get all environment values with defaults.
 
         Returns:
-            Dictionary of environment variable values.
+            Dictionary of environment values keyed by dataclass field name.
         """
+        get = os.environ.get
         return {
-            ENV_SERVER_HOSTNAME: os.getenv(ENV_SERVER_HOSTNAME),
-            ENV_HTTP_PATH: os.getenv(ENV_HTTP_PATH),
-            ENV_ACCESS_TOKEN: os.getenv(ENV_ACCESS_TOKEN),
-            ENV_CATALOG: os.getenv(ENV_CATALOG, DEFAULT_CATALOG),
-            ENV_SCHEMA: os.getenv(ENV_SCHEMA, DEFAULT_SCHEMA),
-            ENV_TEMP_DIR: os.getenv(ENV_TEMP_DIR, DEFAULT_TEMP_DIR),
+            "server_hostname": get(ENV_SERVER_HOSTNAME),
+            "http_path": get(ENV_HTTP_PATH),
+            "access_token": get(ENV_ACCESS_TOKEN),
+            "catalog": get(ENV_CATALOG, DEFAULT_CATALOG),
+            "schema": get(ENV_SCHEMA, DEFAULT_SCHEMA),
+            "temp_dir": get(ENV_TEMP_DIR, DEFAULT_TEMP_DIR),
+            "pool_size": int(get(ENV_POOL_SIZE, DEFAULT_POOL_SIZE)),
+            "csv_compression": get(ENV_CSV_COMPRESSION) or None,
         }
 
     @classmethod
@@ -85,15 +119,20 @@ class DatabricksConfig:
         """Validate that required environment variables are set.
 
         Args:
-            env_values: Dictionary of environment variable values.
+            env_values: Dictionary of environment values keyed by field name.
 
         Raises:
             ValueError: If required values are missing.
         """
-        missing_vars = [var for var in REQUIRED_ENV_VARS if not env_values[var]]
+        if all(env_values.get(field) for field in REQUIRED_FIELDS):
+            return
 
-        if missing_vars:
-            cls._raise_missing_config_error(missing_vars)
+        missing_vars = [
+            ENV_VAR_BY_FIELD[field]
+            for field in REQUIRED_FIELDS
+            if not env_values.get(field)
+        ]
+        cls._raise_missing_config_error(missing_vars)
 
     @classmethod
     def _raise_missing_config_error(cls, missing_vars: List[str]) -> None:
@@ -110,29 +149,27 @@ class DatabricksConfig:
         logger.error(error_msg)
         raise ValueError(error_msg)
 
+    # Validation table: (field name, display name, required prefix)
+    _VALIDATION_RULES: ClassVar[Tuple[Tuple[str, str, Optional[str]], ...]] = (
+        ("server_hostname", "Server hostname", None),
+        ("http_path", "HTTP path", "/"),
+        ("temp_dir", "Temporary directory", None),
+    )
+
     def validate(self) -> None:
         """Validate the configuration values.
 
         Raises:
             ValueError: If configuration is invalid.
         """
-        self._validate_hostname()
-        self._validate_http_path()
-        self._validate_temp_dir()
-
-    def _validate_hostname(self) -> None:
-        """Validate server hostname."""
-        if not self.server_hostname or not self.server_hostname.strip():
-            raise ValueError("Server hostname cannot be empty")
-
-    def _validate_http_path(self) -> None:
-        """Validate HTTP path."""
-        if not self.http_path or not self.http_path.strip():
-            raise ValueError("HTTP path cannot be empty")
-        if not self.http_path.startswith("/"):
-            raise ValueError("HTTP path must start with '/'")
-
-    def _validate_temp_dir(self) -> None:
-        """Validate temporary directory path."""
-        if not self.temp_dir or not self.temp_dir.strip():
-            raise ValueError("Temporary directory cannot be empty")
+        for field_name, display_name, prefix in self._VALIDATION_RULES:
+            value = getattr(self, field_name)
+            if not value or value.isspace():
+                raise ValueError(f"{display_name} cannot be empty")
+            if prefix and not value.startswith(prefix):
+                raise ValueError(f"{display_name} must start with '{prefix}'")
+
+        if self.csv_compression not in CSV_COMPRESSION_OPTIONS:
+            raise ValueError(
+                f"CSV compression must be one of {CSV_COMPRESSION_OPTIONS}"
+            )
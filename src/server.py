@@ -3,8 +3,6 @@
 import logging
 from typing import Optional
 
-from fastmcp import FastMCP
-
 from .config import DatabricksConfig
 from .services import DatabricksService
 from .tools import QueryTool, TableCompareTool
@@ -26,6 +24,10 @@ class DatabricksMCPServer:
 
     def __init__(self):
         """Initialize server components."""
+        # Imported here so importing this module stays cheap; fastmcp
+        # pulls in pydantic and starlette
+        from fastmcp import FastMCP
+
         self.mcp = FastMCP(name=SERVER_NAME, instructions=SERVER_INSTRUCTIONS)
         self.config: Optional[DatabricksConfig] = None
         self._reset_services()
@@ -64,7 +66,7 @@ class DatabricksMCPServer:
         Returns:
             False to indicate initialization failure.
         """
-        logger.critical(f"Failed to initialize server: {error}", exc_info=True)
+        logger.critical("Failed to initialize server: %s", error, exc_info=True)
         self._reset_services()
         return False
 
@@ -79,7 +81,7 @@ class DatabricksMCPServer:
             self.query_tool = QueryTool(self.databricks_service)
             self.table_compare_tool = TableCompareTool(self.databricks_service)
         except Exception as e:
-            logger.error(f"Failed to initialize services: {e}")
+            logger.error("Failed to initialize services: %s", e)
             raise
 
     def _register_tools(self) -> None:
@@ -89,26 +91,23 @@ class DatabricksMCPServer:
             Exception: If tool registration fails.
         """
         try:
-            self._register_query_tools()
-            self._register_comparison_tools()
+            register = self.mcp.tool()
+            for tool_fn in (
+                self.query_tool.execute_query,
+                self.query_tool.execute_query_batch,
+                self.query_tool.get_table_info,
+                self.table_compare_tool.compare_tables,
+                self.table_compare_tool.quick_compare_tables,
+            ):
+                register(tool_fn)
         except Exception as e:
-            logger.error(f"Failed to register tools: {e}")
+            logger.error("Failed to register tools: %s", e)
             raise
 
-    def _register_query_tools(self) -> None:
-        """Register query-related tools."""
-        self.mcp.tool()(self.query_tool.execute_query)
-        self.mcp.tool()(self.query_tool.get_table_info)
-
-    def _register_comparison_tools(self) -> None:
-        """Register table comparison tools."""
-        self.mcp.tool()(self.table_compare_tool.compare_tables)
-        self.mcp.tool()(self.table_compare_tool.quick_compare_tables)
-
     def run(self) -> None:
         """Run the MCP server."""
         server_name = self.mcp.name
-        logger.info(f"Starting FastMCP server '{server_name}'...")
+        logger.info("Starting FastMCP server '%s'...", server_name)
 
         try:
             self.mcp.run()
@@ -116,11 +115,13 @@ class DatabricksMCPServer:
             logger.info("Server interrupted by user")
         except Exception as e:
             logger.critical(
-                f"FastMCP server '{server_name}' encountered a fatal error: {e}",
+                "FastMCP server '%s' encountered a fatal error: %s",
+                server_name,
+                e,
                 exc_info=True,
             )
         finally:
-            logger.info(f"FastMCP server '{server_name}' stopped.")
+            logger.info("FastMCP server '%s' stopped.", server_name)
 
     def is_initialized(self) -> bool:
         """Check if server is properly initialized.
@@ -128,11 +129,9 @@ class DatabricksMCPServer:
         Returns:
             True if all components are initialized.
         """
-        return all(
-            [
-                self.config is not None,
-                self.databricks_service is not None,
-                self.query_tool is not None,
-                self.table_compare_tool is not None,
-            ]
+        return (
+            self.config is not None
+            and self.databricks_service is not None
+            and self.query_tool is not None
+            and self.table_compare_tool is not None
         )
@@ -1,10 +1,17 @@
 """Service for interacting with Databricks."""
 
+import csv
+import io
 import logging
 import os
-from typing import Any, Dict, List, Optional, Tuple
-
-import pandas as pd
+import queue
+import threading
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import pyarrow as pa
+import pyarrow.csv as pacsv
+from cachetools import TTLCache
 from databricks import sql
 
 from ..config import DatabricksConfig
@@ -14,6 +21,32 @@ logger = logging.getLogger(__name__)
 # Constants
 DEFAULT_QUERY_LOG_LENGTH = 100
 CSV_FILE_EXTENSION = ".csv"
+FETCH_BATCH_SIZE = 10_000  # Rows fetched per cursor batch
+CSV_WRITE_BATCH_SIZE = 65536  # Rows per Arrow CSV writer batch
+CSV_WRITE_BUFFER_SIZE = 8 * 1024 * 1024  # Output file buffer size in bytes
+CSV_COMPRESSION_EXTENSIONS = {"gzip": ".gz", "zstd": ".zst"}
+META_CACHE_SIZE = 512  # Cached table-metadata entries
+META_CACHE_TTL_SECONDS = 60  # Lifetime of cached table metadata
+POOL_WAIT_INTERVAL_SECONDS = 1.0  # Capacity re-check interval for pool waiters
+
+# SQL templates bound once so repeated calls emit byte-identical text,
+# which keeps Databricks' query-plan cache hitting
+_SQL_SELECT_ALL = "SELECT * FROM {}".format
+_SQL_DESCRIBE = "DESCRIBE TABLE {}".format
+_SQL_COUNT = "SELECT COUNT(*) as row_count FROM {}".format
+_SQL_DETAIL_COUNT = "SELECT numRecords AS row_count FROM (DESCRIBE DETAIL {})".format
+
+
+@lru_cache(maxsize=256)
+def _qualified_table_name(catalog: str, schema: str, table_name: str) -> str:
+    """Build (and memoize) a catalog.schema.table identifier."""
+    return f"{catalog}.{schema}.{table_name}"
+
+
+# Temp directories already created by this process; saves a makedirs
+# syscall for every service constructed against the same path
+_ENSURED_DIRS: set = set()
+_ENSURED_DIRS_LOCK = threading.Lock()
 
 
 class DatabricksServiceError(Exception):
@@ -36,19 +69,42 @@ class DatabricksService:
         """
         self.config = config
         self._ensure_temp_dir()
+        self._pool: queue.Queue = queue.Queue(maxsize=config.pool_size)
+        self._pool_lock = threading.Lock()
+        self._pool_created = 0
+        # Precomputed prefix for the common default-catalog/schema case
+        self._default_table_prefix = f"{config.catalog}.{config.schema}."
+        # Short-lived cache of table metadata; user SQL is never cached.
+        # TTLCache is not thread-safe and the compare tools call in from
+        # worker threads, so every access goes through the lock
+        self._meta_cache: TTLCache = TTLCache(
+            maxsize=META_CACHE_SIZE, ttl=META_CACHE_TTL_SECONDS
+        )
+        self._meta_cache_lock = threading.Lock()
+        # Tables that rejected DESCRIBE DETAIL (views, non-Delta tables);
+        # remembered so the probe is not repeated every cache expiry.
+        # Membership test and add are each single atomic operations
+        self._detail_unsupported: set = set()
 
     def _ensure_temp_dir(self) -> None:
-        """Ensure temporary directory exists."""
+        """Ensure temporary directory exists (once per process and path)."""
+        temp_dir = self.config.temp_dir
+        with _ENSURED_DIRS_LOCK:
+            if temp_dir in _ENSURED_DIRS:
+                return
         try:
-            os.makedirs(self.config.temp_dir, exist_ok=True)
+            if not os.path.isdir(temp_dir):
+                os.makedirs(temp_dir, exist_ok=True)
         except OSError as e:
             raise DatabricksServiceError(f"Failed to create temp directory: {e}")
+        with _ENSURED_DIRS_LOCK:
+            _ENSURED_DIRS.add(temp_dir)
 
     def _get_connection(self):
-        """Get a Databricks SQL connection.
+        """Open a new Databricks SQL connection.
 
         Returns:
-            A Databricks SQL connection context manager.
+            A Databricks SQL connection.
 
         Raises:
             DatabricksServiceError: If connection fails.
@@ -62,57 +118,199 @@ class DatabricksService:
         except Exception as e:
             raise DatabricksServiceError(f"Failed to connect to Databricks: {e}")
 
-    def _execute_sql_query(self, query: str) -> Tuple[List[str], List[Any]]:
-        """Execute SQL query and return column names and rows.
+    def _run_on_connection(self, operation: Callable[[Any], Any]) -> Any:
+        """Run an operation with a pooled connection, retrying stale reuses.
+
+        Reuses idle pooled connections to avoid paying the TCP/TLS/auth
+        handshake on every query; opens a new one while the pool is below
+        config.pool_size. A connection that sat idle in the pool may have
+        expired server-side (warehouse auto-stop, idle session timeout),
+        so if a reused connection fails with a connection-level error the
+        whole idle pool is dropped and the operation retried once on a
+        fresh connection. Query-level errors and failures on fresh
+        connections propagate unchanged; the failing connection is always
+        discarded rather than returned to the pool.
+
+        Args:
+            operation: Callable invoked with the checked-out connection.
+
+        Returns:
+            The operation's return value.
+
+        Raises:
+            DatabricksServiceError: If a new connection cannot be opened.
+        """
+        connection, reused = self._acquire_connection()
+
+        try:
+            result = operation(connection)
+        except Exception as e:
+            self._discard_connection(connection)
+            if not (reused and self._is_connection_error(e)):
+                raise
+            # Idle pool-mates shared the same idle period and are almost
+            # certainly just as stale; drop them so the retry (and later
+            # checkouts) dial fresh sessions
+            logger.debug(
+                "Reused pooled connection failed (%s); retrying on a fresh one", e
+            )
+            self.close()
+            connection, _ = self._acquire_connection()
+        else:
+            self._pool.put(connection)
+            return result
+
+        try:
+            result = operation(connection)
+        except Exception:
+            self._discard_connection(connection)
+            raise
+        self._pool.put(connection)
+        return result
+
+    def _acquire_connection(self) -> Tuple[Any, bool]:
+        """Get an idle pooled connection, or open one within capacity.
+
+        Waiters at capacity poll the pool with a timeout and re-check
+        capacity on each wakeup: a discarded connection frees a capacity
+        slot without putting anything back into the queue, so a blocking
+        get() with no timeout could wait forever on a pool that will
+        never be refilled.
+
+        Returns:
+            Tuple of (connection, reused); reused is True when the
+            connection had been sitting idle in the pool.
+        """
+        try:
+            return self._pool.get_nowait(), True
+        except queue.Empty:
+            pass
+
+        while True:
+            with self._pool_lock:
+                below_capacity = self._pool_created < self.config.pool_size
+                if below_capacity:
+                    self._pool_created += 1
+
+            if below_capacity:
+                try:
+                    return self._get_connection(), False
+                except Exception:
+                    with self._pool_lock:
+                        self._pool_created -= 1
+                    raise
+
+            try:
+                return self._pool.get(timeout=POOL_WAIT_INTERVAL_SECONDS), True
+            except queue.Empty:
+                continue
+
+    @staticmethod
+    def _is_connection_error(error: Exception) -> bool:
+        """Check whether an error indicts the connection or session itself.
+
+        Transport and session errors (expired session, closed handle,
+        network failures) surface as InterfaceError or OperationalError
+        subclasses; query-level failures raise ServerOperationError,
+        which is neither, and would fail again on any connection.
+
+        Args:
+            error: The exception raised while using a connection.
+
+        Returns:
+            True if retrying on a fresh connection could succeed.
+        """
+        return isinstance(error, (sql.exc.InterfaceError, sql.exc.OperationalError))
+
+    def _discard_connection(self, connection: Any) -> None:
+        """Close a connection and remove it from the pool accounting.
+
+        Args:
+            connection: The connection to discard.
+        """
+        with self._pool_lock:
+            self._pool_created -= 1
+        try:
+            connection.close()
+        except Exception as e:
+            logger.warning(f"Failed to close discarded connection: {e}")
+
+    def close(self) -> None:
+        """Close all idle pooled connections."""
+        while True:
+            try:
+                connection = self._pool.get_nowait()
+            except queue.Empty:
+                break
+            self._discard_connection(connection)
+
+    def _execute_sql_query(self, query: str) -> Tuple[List[str], List[Dict[str, Any]]]:
+        """Execute SQL query and return column names and row records.
+
+        Prefers the connector's Arrow transport: the result arrives as
+        typed columnar buffers and pyarrow converts it to records in C,
+        instead of boxing every cell into Python tuples first and
+        zipping them back together row by row.
 
         Args:
             query: SQL query to execute.
 
         Returns:
-            Tuple of (column_names, rows).
+            Tuple of (column_names, records).
 
         Raises:
             DatabricksServiceError: If query execution fails.
         """
-        with self._get_connection() as connection:
-            with connection.cursor() as cursor:
-                cursor.execute(query)
-
-                # Get column names
-                columns = (
-                    [desc[0] for desc in cursor.description]
-                    if cursor.description
-                    else []
-                )
+        return self._run_on_connection(
+            lambda connection: self._fetch_query_records(connection, query)
+        )
+
+    @staticmethod
+    def _fetch_query_records(
+        connection: Any, query: str
+    ) -> Tuple[List[str], List[Dict[str, Any]]]:
+        """Execute a query on a connection and fetch all records.
+
+        Args:
+            connection: The connection to execute on.
+            query: SQL query to execute.
+
+        Returns:
+            Tuple of (column_names, records).
+        """
+        with connection.cursor() as cursor:
+            cursor.execute(query)
+
+            if getattr(cursor, "fetchall_arrow", None) is not None:
+                table = cursor.fetchall_arrow()
+                return table.column_names, table.to_pylist()
+
+            # Get column names
+            columns = (
+                [desc[0] for desc in cursor.description]
+                if cursor.description
+                else []
+            )
 
-                # Fetch all results
-                rows = cursor.fetchall()
+            # Fetch all results
+            rows = cursor.fetchall()
 
-                return columns, rows
+            return columns, [dict(zip(columns, row)) for row in rows]
 
     def _create_result_dict(
-        self, query: str, columns: List[str], rows: List[Any]
+        self, query: str, columns: List[str], data: List[Dict[str, Any]]
     ) -> Dict[str, Any]:
         """Create standardized result dictionary.
 
         Args:
             query: The executed query.
             columns: Column names.
-            rows: Query result rows.
+            data: Query result rows as column-keyed records.
 
         Returns:
             Standardized result dictionary.
         """
-        if rows and columns:
-            df = pd.DataFrame(rows, columns=columns)
-            return {
-                "success": True,
-                "row_count": len(df),
-                "columns": columns,
-                "data": df.to_dict("records"),
-                "query": query,
-            }
-        else:
+        if not data or not columns:
             return {
                 "success": True,
                 "row_count": 0,
@@ -121,6 +319,156 @@ class DatabricksService:
                 "query": query,
             }
 
+        return {
+            "success": True,
+            "row_count": len(data),
+            "columns": columns,
+            "data": data,
+            "query": query,
+        }
+
+    def _stream_query_to_csv(self, query: str, csv_path: str) -> int:
+        """Execute a query and stream its results to a CSV file in batches.
+
+        Fetches FETCH_BATCH_SIZE rows at a time and appends them to the
+        file as they arrive, so peak memory is bounded by the batch size
+        rather than the full result set.
+
+        Args:
+            query: SQL query to execute.
+            csv_path: Destination CSV file path.
+
+        Returns:
+            Number of data rows written.
+
+        Raises:
+            DatabricksServiceError: If query execution fails.
+        """
+        logger.info(f"Executing query: {query[:DEFAULT_QUERY_LOG_LENGTH]}...")
+
+        return self._run_on_connection(
+            lambda connection: self._stream_connection_to_csv(
+                connection, query, csv_path
+            )
+        )
+
+    def _stream_connection_to_csv(
+        self, connection: Any, query: str, csv_path: str
+    ) -> int:
+        """Execute a query on a connection and write its result as CSV.
+
+        Args:
+            connection: The connection to execute on.
+            query: SQL query to execute.
+            csv_path: Destination CSV file path.
+
+        Returns:
+            Number of data rows written.
+        """
+        with connection.cursor() as cursor:
+            cursor.arraysize = FETCH_BATCH_SIZE
+            cursor.execute(query)
+
+            # Prefer the connector's Arrow transport: batches arrive
+            # as pyarrow Tables without a row-tuple boxing pass and
+            # are written by Arrow's C++ CSV writer
+            if getattr(cursor, "fetchmany_arrow", None) is not None:
+                return self._write_arrow_batches_to_csv(cursor, csv_path)
+
+            return self._write_row_batches_to_csv(cursor, csv_path)
+
+    def _write_arrow_batches_to_csv(self, cursor, csv_path: str) -> int:
+        """Write Arrow result batches from a cursor to a CSV file.
+
+        Args:
+            cursor: Executed cursor exposing fetchmany_arrow.
+            csv_path: Destination CSV file path.
+
+        Returns:
+            Number of data rows written.
+        """
+        row_count = 0
+        writer = None
+        sink = None
+        raw = None
+
+        try:
+            while True:
+                batch = cursor.fetchmany_arrow(FETCH_BATCH_SIZE)
+                if batch.num_rows == 0:
+                    break
+                if writer is None:
+                    # Oversized block buffer keeps syscall count low
+                    raw = open(csv_path, "wb", buffering=CSV_WRITE_BUFFER_SIZE)
+                    sink = self._wrap_compressed(raw)
+                    writer = pacsv.CSVWriter(
+                        sink,
+                        batch.schema,
+                        write_options=pacsv.WriteOptions(
+                            batch_size=CSV_WRITE_BATCH_SIZE
+                        ),
+                    )
+                writer.write_table(batch)
+                row_count += batch.num_rows
+        finally:
+            if writer is not None:
+                writer.close()
+            if sink is not None:
+                sink.close()
+            if raw is not None and not raw.closed:
+                raw.close()
+
+        return row_count
+
+    def _write_row_batches_to_csv(self, cursor, csv_path: str) -> int:
+        """Write row-tuple result batches from a cursor to a CSV file.
+
+        Fallback for cursors without Arrow support.
+
+        Args:
+            cursor: Executed cursor.
+            csv_path: Destination CSV file path.
+
+        Returns:
+            Number of data rows written.
+        """
+        columns = (
+            [desc[0] for desc in cursor.description] if cursor.description else []
+        )
+
+        row_count = 0
+        raw = open(csv_path, "wb", buffering=CSV_WRITE_BUFFER_SIZE)
+        try:
+            with io.TextIOWrapper(self._wrap_compressed(raw), newline="") as f:
+                writer = csv.writer(f)
+                writer.writerow(columns)
+
+                while True:
+                    batch = cursor.fetchmany(FETCH_BATCH_SIZE)
+                    if not batch:
+                        break
+                    writer.writerows(batch)
+                    row_count += len(batch)
+        finally:
+            if not raw.closed:
+                raw.close()
+
+        return row_count
+
+    def _wrap_compressed(self, raw: Any) -> Any:
+        """Wrap a binary sink in the configured compression stream.
+
+        Args:
+            raw: Open binary file object.
+
+        Returns:
+            The raw sink, or a pyarrow CompressedOutputStream around it.
+        """
+        compression = self.config.csv_compression
+        if compression is None:
+            return raw
+        return pa.CompressedOutputStream(raw, compression)
+
     def execute_query(self, query: str) -> Dict[str, Any]:
         """Execute a SQL query and return results.
 
@@ -136,8 +484,8 @@ class DatabricksService:
         logger.info(f"Executing query: {query[:DEFAULT_QUERY_LOG_LENGTH]}...")
 
         try:
-            columns, rows = self._execute_sql_query(query)
-            result = self._create_result_dict(query, columns, rows)
+            columns, data = self._execute_sql_query(query)
+            result = self._create_result_dict(query, columns, data)
             logger.info(
                 f"Query executed successfully, returned {result['row_count']} rows"
             )
@@ -164,25 +512,28 @@ class DatabricksService:
         Returns:
             Full table name in format: catalog.schema.table_name
         """
-        catalog = catalog or self.config.catalog
-        schema = schema or self.config.schema
-        return f"{catalog}.{schema}.{table_name}"
+        if catalog is None and schema is None:
+            return self._default_table_prefix + table_name
+        return _qualified_table_name(
+            catalog or self.config.catalog,
+            schema or self.config.schema,
+            table_name,
+        )
 
-    def _save_dataframe_to_csv(self, df: pd.DataFrame, table_name: str) -> str:
-        """Save DataFrame to CSV file.
+    def _build_csv_path(self, table_name: str) -> str:
+        """Build the CSV output path for a table.
 
         Args:
-            df: DataFrame to save.
             table_name: Table name for CSV filename.
 
         Returns:
-            Path to saved CSV file.
+            Path to the CSV file, including the compression suffix when
+            config.csv_compression is set.
         """
-        csv_path = os.path.join(
-            self.config.temp_dir, f"{table_name}{CSV_FILE_EXTENSION}"
+        suffix = CSV_COMPRESSION_EXTENSIONS.get(self.config.csv_compression or "", "")
+        return os.path.join(
+            self.config.temp_dir, f"{table_name}{CSV_FILE_EXTENSION}{suffix}"
         )
-        df.to_csv(csv_path, index=False)
-        return csv_path
 
     def get_table_data(
         self,
@@ -208,19 +559,18 @@ class DatabricksService:
         logger.info(f"Retrieving data from table: {full_table_name}")
 
         try:
-            query = f"SELECT * FROM {full_table_name}"
-            result = self.execute_query(query)
+            query = _SQL_SELECT_ALL(full_table_name)
+            csv_path = self._build_csv_path(table_name)
+            row_count = self._stream_query_to_csv(query, csv_path)
 
-            if not result["success"] or not result["data"]:
+            if row_count == 0:
+                if os.path.exists(csv_path):
+                    os.remove(csv_path)
                 raise DatabricksServiceError(
                     f"No data found in table {full_table_name}"
                 )
 
-            # Convert to DataFrame and save as CSV
-            df = pd.DataFrame(result["data"])
-            csv_path = self._save_dataframe_to_csv(df, table_name)
-
-            logger.info(f"Saved {result['row_count']} rows to {csv_path}")
+            logger.info(f"Saved {row_count} rows to {csv_path}")
             return csv_path
 
         except DatabricksServiceError:
@@ -238,6 +588,9 @@ class DatabricksService:
     ) -> Dict[str, Any]:
         """Get information about a table.
 
+        Results are cached for META_CACHE_TTL_SECONDS per table; use
+        invalidate() or clear_cache() to drop entries early.
+
         Args:
             table_name: Name of the table
             catalog: Optional catalog name
@@ -251,18 +604,31 @@ class DatabricksService:
         """
         full_table_name = self._build_full_table_name(table_name, catalog, schema)
 
-        try:
-            # Get table description
-            desc_result = self._get_table_description(full_table_name)
+        with self._meta_cache_lock:
+            cached = self._meta_cache.get(full_table_name)
+        if cached is not None:
+            # Hand out a copy so callers mutating the result cannot
+            # poison the cached entry for its remaining TTL
+            return {**cached, "columns": list(cached["columns"])}
 
-            # Get row count
-            row_count = self._get_table_row_count(full_table_name)
+        try:
+            probe_detail = full_table_name not in self._detail_unsupported
+            columns, row_count, detail_supported = self._run_on_connection(
+                lambda connection: self._fetch_table_metadata(
+                    connection, full_table_name, probe_detail
+                )
+            )
+            if probe_detail and not detail_supported:
+                self._detail_unsupported.add(full_table_name)
 
-            return {
+            info = {
                 "table_name": full_table_name,
-                "columns": desc_result["data"],
-                "row_count": row_count,
+                "columns": columns,
+                "row_count": row_count if row_count is not None else 0,
             }
+            with self._meta_cache_lock:
+                self._meta_cache[full_table_name] = info
+            return {**info, "columns": list(info["columns"])}
 
         except DatabricksServiceError:
             raise
@@ -271,27 +637,100 @@ class DatabricksService:
             logger.error(error_msg)
             raise DatabricksServiceError(error_msg)
 
-    def _get_table_description(self, full_table_name: str) -> Dict[str, Any]:
-        """Get table description using DESCRIBE TABLE.
+    def _fetch_table_metadata(
+        self, connection: Any, full_table_name: str, probe_detail: bool
+    ) -> Tuple[List[Dict[str, Any]], Optional[int], bool]:
+        """Fetch DESCRIBE output and a row count over one connection.
+
+        Delta tables expose a precomputed row count through DESCRIBE
+        DETAIL, avoiding a full COUNT(*) scan. The probe runs on its own
+        cursor and its failure — expected for views and non-Delta
+        tables — is handled right here, so the healthy connection is
+        neither discarded nor redialed for the COUNT(*) fallback.
 
         Args:
-            full_table_name: Full table name including catalog and schema.
+            connection: The connection to execute on.
+            full_table_name: Fully qualified table name.
+            probe_detail: Whether to try DESCRIBE DETAIL for the count.
 
         Returns:
-            Query result containing table description.
+            Tuple of (columns, row_count, detail_supported).
         """
-        desc_query = f"DESCRIBE TABLE {full_table_name}"
-        return self.execute_query(desc_query)
+        columns = self._fetch_statement_records(
+            connection, _SQL_DESCRIBE(full_table_name)
+        )
 
-    def _get_table_row_count(self, full_table_name: str) -> int:
-        """Get table row count.
+        row_count: Optional[int] = None
+        detail_supported = probe_detail
+        if probe_detail:
+            try:
+                detail_rows = self._fetch_statement_records(
+                    connection, _SQL_DETAIL_COUNT(full_table_name)
+                )
+            except Exception as e:
+                if self._is_connection_error(e):
+                    raise
+                logger.debug(
+                    "DESCRIBE DETAIL unavailable for %s; "
+                    "falling back to COUNT(*): %s",
+                    full_table_name,
+                    e,
+                )
+                detail_supported = False
+            else:
+                row_count = detail_rows[0].get("row_count") if detail_rows else None
+
+        if row_count is None:
+            # Statistics can be absent; fall back to a full count
+            count_rows = self._fetch_statement_records(
+                connection, _SQL_COUNT(full_table_name)
+            )
+            row_count = count_rows[0].get("row_count") if count_rows else None
+
+        return columns, row_count, detail_supported
+
+    @staticmethod
+    def _fetch_statement_records(
+        connection: Any, query: str
+    ) -> List[Dict[str, Any]]:
+        """Execute a statement on its own cursor and fetch row records.
 
         Args:
-            full_table_name: Full table name including catalog and schema.
+            connection: The connection to execute on.
+            query: SQL statement to execute.
 
         Returns:
-            Number of rows in the table.
+            Query result rows as column-keyed records.
         """
-        count_query = f"SELECT COUNT(*) as row_count FROM {full_table_name}"
-        count_result = self.execute_query(count_query)
-        return count_result["data"][0]["row_count"] if count_result["data"] else 0
+        logger.info(f"Executing query: {query[:DEFAULT_QUERY_LOG_LENGTH]}...")
+        with connection.cursor() as cursor:
+            cursor.execute(query)
+            columns = (
+                [desc[0] for desc in cursor.description]
+                if cursor.description
+                else []
+            )
+            rows = cursor.fetchall()
+            return [dict(zip(columns, row)) for row in rows]
+
+    def invalidate(
+        self,
+        table_name: str,
+        catalog: Optional[str] = None,
+        schema: Optional[str] = None,
+    ) -> None:
+        """Drop any cached metadata for a table.
+
+        Args:
+            table_name: Name of the table.
+            catalog: Optional catalog name.
+            schema: Optional schema name.
+        """
+        full_table_name = self._build_full_table_name(table_name, catalog, schema)
+        with self._meta_cache_lock:
+            self._meta_cache.pop(full_table_name, None)
+
+    def clear_cache(self) -> None:
+        """Drop all cached table metadata."""
+        with self._meta_cache_lock:
+            self._meta_cache.clear()
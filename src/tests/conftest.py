@@ -1,7 +1,7 @@
 """Pytest configuration and fixtures for Databricks MCP Server tests."""
 
 import os
-import tempfile
+from pathlib import Path
 from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
@@ -45,38 +45,35 @@ def mock_context():
     return context
 
 
-@pytest.fixture
-def temp_csv_files():
-    """Create temporary CSV files for testing."""
-    with tempfile.TemporaryDirectory() as temp_dir:
-        file1 = os.path.join(temp_dir, "table1.csv")
-        file2 = os.path.join(temp_dir, "table2.csv")
-
-        # Create identical files
-        with open(file1, "w") as f:
-            f.write("id,name,value\n1,test,100\n2,example,200\n")
-
-        with open(file2, "w") as f:
-            f.write("id,name,value\n1,test,100\n2,example,200\n")
+# Canned CSV bodies for the comparison fixtures; written as bytes in a
+# single call so each fixture costs one open/write per file
+_CSV_BASE = b"id,name,value\n1,test,100\n2,example,200\n"
+_CSV_CHANGED = b"id,name,value\n1,test,150\n2,example,250\n"
 
-        yield file1, file2
 
+def _make_csv_pair(temp_dir, content1, content2):
+    """Write two CSV files into temp_dir and return their paths."""
+    file1 = os.path.join(temp_dir, "table1.csv")
+    file2 = os.path.join(temp_dir, "table2.csv")
+    Path(file1).write_bytes(content1)
+    Path(file2).write_bytes(content2)
+    return file1, file2
 
-@pytest.fixture
-def temp_different_csv_files():
-    """Create temporary CSV files with differences for testing."""
-    with tempfile.TemporaryDirectory() as temp_dir:
-        file1 = os.path.join(temp_dir, "table1.csv")
-        file2 = os.path.join(temp_dir, "table2.csv")
 
-        # Create different files
-        with open(file1, "w") as f:
-            f.write("id,name,value\n1,test,100\n2,example,200\n")
+# Session scope: the comparison tests only read these files, so one
+# copy on disk can serve every test
+@pytest.fixture(scope="session")
+def temp_csv_files(tmp_path_factory):
+    """Create temporary identical CSV files for testing."""
+    temp_dir = tmp_path_factory.mktemp("identical_csvs")
+    return _make_csv_pair(str(temp_dir), _CSV_BASE, _CSV_BASE)
 
-        with open(file2, "w") as f:
-            f.write("id,name,value\n1,test,150\n2,example,250\n")
 
-        yield file1, file2
+@pytest.fixture(scope="session")
+def temp_different_csv_files(tmp_path_factory):
+    """Create temporary CSV files with differences for testing."""
+    temp_dir = tmp_path_factory.mktemp("different_csvs")
+    return _make_csv_pair(str(temp_dir), _CSV_BASE, _CSV_CHANGED)
 
 
 @pytest.fixture
@@ -5,6 +5,7 @@ import tempfile
 from unittest.mock import MagicMock, Mock, patch
 
 import pandas as pd
+import pyarrow as pa
 import pytest
 
 from src.services.databricks_service import (DatabricksService,
@@ -20,6 +21,13 @@ def mock_connection():
     # Configure cursor behavior
     cursor.description = [("id",), ("name",), ("value",)]
     cursor.fetchall.return_value = [(1, "test", 100), (2, "example", 200)]
+    cursor.fetchmany.side_effect = [[(1, "test", 100), (2, "example", 200)], []]
+
+    arrow_batch = pa.table(
+        {"id": [1, 2], "name": ["test", "example"], "value": [100, 200]}
+    )
+    cursor.fetchmany_arrow.side_effect = [arrow_batch, arrow_batch.slice(0, 0)]
+    cursor.fetchall_arrow.return_value = arrow_batch
 
     connection.cursor.return_value.__enter__.return_value = cursor
     return connection
@@ -36,7 +44,7 @@ def test_databricks_service_initialization(mock_connect, test_config):
 @patch("src.services.databricks_service.sql.connect")
 def test_execute_query_success(mock_connect, test_config, mock_connection):
     """Test successful query execution."""
-    mock_connect.return_value.__enter__.return_value = mock_connection
+    mock_connect.return_value = mock_connection
 
     service = DatabricksService(test_config)
     result = service.execute_query("SELECT * FROM test_table")
@@ -68,9 +76,10 @@ def test_execute_query_empty_result(mock_connect, test_config):
     cursor = MagicMock()
     cursor.description = None
     cursor.fetchall.return_value = []
+    cursor.fetchall_arrow.return_value = pa.table({})
 
     connection.cursor.return_value.__enter__.return_value = cursor
-    mock_connect.return_value.__enter__.return_value = connection
+    mock_connect.return_value = connection
 
     service = DatabricksService(test_config)
     result = service.execute_query("SELECT * FROM empty_table")
@@ -84,7 +93,7 @@ def test_execute_query_empty_result(mock_connect, test_config):
 @patch("src.services.databricks_service.sql.connect")
 def test_get_table_data_success(mock_connect, test_config, mock_connection):
     """Test successful table data retrieval."""
-    mock_connect.return_value.__enter__.return_value = mock_connection
+    mock_connect.return_value = mock_connection
 
     service = DatabricksService(test_config)
     csv_path = service.get_table_data("test_table")
@@ -105,9 +114,11 @@ def test_get_table_data_no_data(mock_connect, test_config):
     cursor = MagicMock()
     cursor.description = None
     cursor.fetchall.return_value = []
+    cursor.fetchmany.return_value = []
+    cursor.fetchmany_arrow.return_value = pa.table({})
 
     connection.cursor.return_value.__enter__.return_value = cursor
-    mock_connect.return_value.__enter__.return_value = connection
+    mock_connect.return_value = connection
 
     service = DatabricksService(test_config)
 
@@ -142,7 +153,7 @@ def test_get_table_info_success(mock_connect, test_config):
     # Return different cursors for different queries
     cursors = [describe_cursor, count_cursor]
     connection.cursor.return_value.__enter__.side_effect = cursors
-    mock_connect.return_value.__enter__.return_value = connection
+    mock_connect.return_value = connection
 
     service = DatabricksService(test_config)
     result = service.get_table_info("test_table")
@@ -172,7 +183,7 @@ def test_get_table_info_with_custom_catalog_schema(test_config):
         # Return different cursors for different queries
         cursors = [describe_cursor, count_cursor]
         connection.cursor.return_value.__enter__.side_effect = cursors
-        mock_connect.return_value.__enter__.return_value = connection
+        mock_connect.return_value = connection
 
         service = DatabricksService(test_config)
         result = service.get_table_info("test_table", "custom_catalog", "custom_schema")
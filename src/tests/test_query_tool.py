@@ -25,6 +25,31 @@ async def test_execute_query_success(
     mock_context.info.assert_called()
 
 
+@pytest.mark.asyncio
+async def test_execute_query_batch(
+    mock_context, mock_databricks_service, sample_query_result
+):
+    """Test batch query execution with a per-query failure."""
+    mock_databricks_service.execute_query.side_effect = [
+        sample_query_result,
+        DatabricksServiceError("Table not found"),
+    ]
+
+    tool = QueryTool(mock_databricks_service)
+    results = await tool.execute_query_batch(
+        mock_context,
+        queries=["SELECT * FROM test_table", "SELECT * FROM missing_table"],
+    )
+
+    assert len(results) == 2
+    assert results[0]["success"] is True
+    assert results[0]["row_count"] == 2
+    assert results[1]["success"] is False
+    assert "Table not found" in results[1]["error"]
+    mock_context.info.assert_called()
+    mock_context.error.assert_called()
+
+
 @pytest.mark.asyncio
 async def test_execute_query_with_limit(
     mock_context, mock_databricks_service, sample_query_result
@@ -1,33 +1,53 @@
 """Tests for Databricks MCP server."""
 
+import types
 from unittest.mock import Mock, patch
 
 import pytest
 
 from src.config import DatabricksConfig
 from src.server import DatabricksMCPServer
+from src.services.databricks_service import DatabricksService
+from src.tools.query_tool import QueryTool
+from src.tools.table_compare_tool import TableCompareTool
 
 
-def test_server_initialization(test_config):
+@pytest.fixture
+def patched_server_deps(monkeypatch):
+    """Replace the server's collaborators with per-test mocks."""
+    service = Mock(spec=DatabricksService)
+    query_tool = Mock(spec=QueryTool)
+    compare_tool = Mock(spec=TableCompareTool)
+
+    monkeypatch.setattr("src.server.DatabricksService", lambda *a, **kw: service)
+    monkeypatch.setattr("src.server.QueryTool", lambda *a, **kw: query_tool)
+    monkeypatch.setattr("src.server.TableCompareTool", lambda *a, **kw: compare_tool)
+    return service, query_tool, compare_tool
+
+
+def test_server_initialization(test_config, patched_server_deps, monkeypatch):
     """Test server initialization with config."""
-    with patch("src.server.DatabricksService"), patch("src.server.QueryTool"), patch(
-        "src.server.TableCompareTool"
-    ), patch.object(DatabricksMCPServer, "_register_tools"):
+    monkeypatch.setattr(DatabricksMCPServer, "_register_tools", lambda self: None)
 
-        server = DatabricksMCPServer()
-        assert server.initialize(test_config) is True
-        assert server.config == test_config
-        assert server.databricks_service is not None
-        assert server.query_tool is not None
-        assert server.table_compare_tool is not None
+    server = DatabricksMCPServer()
+    assert server.initialize(test_config) is True
+    assert server.config == test_config
+    assert server.databricks_service is not None
+    assert server.query_tool is not None
+    assert server.table_compare_tool is not None
 
 
-def test_server_initialization_failure(test_config):
+def test_server_initialization_failure(test_config, monkeypatch):
     """Test server initialization failure handling."""
-    with patch("src.server.DatabricksService", side_effect=Exception("Init failed")):
-        server = DatabricksMCPServer()
-        assert server.initialize(test_config) is False
-        assert server.databricks_service is None
+
+    def raise_init_failed(*a, **kw):
+        raise Exception("Init failed")
+
+    monkeypatch.setattr("src.server.DatabricksService", raise_init_failed)
+
+    server = DatabricksMCPServer()
+    assert server.initialize(test_config) is False
+    assert server.databricks_service is None
 
 
 def test_server_reset_services():
@@ -39,31 +59,43 @@ def test_server_reset_services():
     assert server.table_compare_tool is None
 
 
-def test_server_register_tools():
-    """Test tool registration."""
-    server = DatabricksMCPServer()
+# Mock tool methods that are actual functions (not Mock objects),
+# compiled once at import instead of per test run
+async def mock_execute_query(context, query: str):
+    pass
+
+
+async def mock_execute_query_batch(context, queries: list):
+    pass
+
 
-    # Create mock methods that are actual functions (not Mock objects)
-    async def mock_execute_query(context, query: str):
-        pass
+async def mock_get_table_info(context, table_name: str):
+    pass
 
-    async def mock_get_table_info(context, table_name: str):
-        pass
 
-    async def mock_compare_tables(context, table1: str, table2: str):
-        pass
+async def mock_compare_tables(context, table1: str, table2: str):
+    pass
 
-    async def mock_quick_compare_tables(context, table1: str, table2: str):
-        pass
 
-    # Create mock objects with real methods
-    server.query_tool = Mock()
-    server.query_tool.execute_query = mock_execute_query
-    server.query_tool.get_table_info = mock_get_table_info
+async def mock_quick_compare_tables(context, table1: str, table2: str):
+    pass
+
+
+def test_server_register_tools():
+    """Test tool registration."""
+    server = DatabricksMCPServer()
 
-    server.table_compare_tool = Mock()
-    server.table_compare_tool.compare_tables = mock_compare_tables
-    server.table_compare_tool.quick_compare_tables = mock_quick_compare_tables
+    # SimpleNamespace containers are far cheaper than Mock objects and
+    # only need to expose the registered attributes
+    server.query_tool = types.SimpleNamespace(
+        execute_query=mock_execute_query,
+        execute_query_batch=mock_execute_query_batch,
+        get_table_info=mock_get_table_info,
+    )
+    server.table_compare_tool = types.SimpleNamespace(
+        compare_tables=mock_compare_tables,
+        quick_compare_tables=mock_quick_compare_tables,
+    )
 
     # This should not raise an exception
     server._register_tools()
@@ -72,10 +104,7 @@ def test_server_register_tools():
     # The actual tool registration is handled by FastMCP internally
 
 
-@patch("src.server.DatabricksService")
-@patch("src.server.QueryTool")
-@patch("src.server.TableCompareTool")
-def test_server_run(mock_table_tool, mock_query_tool, mock_service, test_config):
+def test_server_run(test_config, patched_server_deps):
     """Test server run method."""
     server = DatabricksMCPServer()
     server.initialize(test_config)
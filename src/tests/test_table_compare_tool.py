@@ -1,22 +1,44 @@
 """Tests for table compare tool."""
 
-from unittest.mock import Mock, patch
+import gzip
+from unittest.mock import Mock
 
 import pytest
 
 from src.services.databricks_service import DatabricksServiceError
 from src.tools.table_compare_tool import TableCompareTool
 
+# Shared placeholder service for the _run_diff_command tests, which
+# never touch the service; built once instead of per test
+_DUMMY_SERVICE = Mock()
 
-@pytest.mark.asyncio
-async def test_compare_tables_success(
-    mock_context, mock_databricks_service, temp_csv_files
-):
-    """Test successful table comparison."""
+
+@pytest.fixture
+def mock_service_with_csv(mock_databricks_service, temp_csv_files):
+    """Service mock pre-wired to return the identical CSV pair."""
     file1, file2 = temp_csv_files
-    mock_databricks_service.get_table_data.side_effect = [file1, file2]
+    # Keyed on the table name because the tool downloads both tables
+    # concurrently, so call order is not deterministic
+    mock_databricks_service.get_table_data.side_effect = (
+        lambda table, *args: file1 if table == "table1" else file2
+    )
+    return mock_databricks_service
 
-    tool = TableCompareTool(mock_databricks_service)
+
+@pytest.fixture
+def mock_service_with_different_csv(mock_databricks_service, temp_different_csv_files):
+    """Service mock pre-wired to return the differing CSV pair."""
+    file1, file2 = temp_different_csv_files
+    mock_databricks_service.get_table_data.side_effect = (
+        lambda table, *args: file1 if table == "table1" else file2
+    )
+    return mock_databricks_service
+
+
+@pytest.mark.asyncio
+async def test_compare_tables_success(mock_context, mock_service_with_csv):
+    """Test successful table comparison."""
+    tool = TableCompareTool(mock_service_with_csv)
     result = await tool.compare_tables(mock_context, table1="table1", table2="table2")
 
     assert result["success"] is True
@@ -29,13 +51,10 @@ async def test_compare_tables_success(
 
 @pytest.mark.asyncio
 async def test_compare_tables_with_differences(
-    mock_context, mock_databricks_service, temp_different_csv_files
+    mock_context, mock_service_with_different_csv
 ):
     """Test table comparison with differences."""
-    file1, file2 = temp_different_csv_files
-    mock_databricks_service.get_table_data.side_effect = [file1, file2]
-
-    tool = TableCompareTool(mock_databricks_service)
+    tool = TableCompareTool(mock_service_with_different_csv)
     result = await tool.compare_tables(
         mock_context, table1="table1", table2="table2", diff_lines=5
     )
@@ -48,13 +67,10 @@ async def test_compare_tables_with_differences(
 
 @pytest.mark.asyncio
 async def test_compare_tables_with_catalogs_schemas(
-    mock_context, mock_databricks_service, temp_csv_files
+    mock_context, mock_service_with_csv
 ):
     """Test table comparison with specific catalogs and schemas."""
-    file1, file2 = temp_csv_files
-    mock_databricks_service.get_table_data.side_effect = [file1, file2]
-
-    tool = TableCompareTool(mock_databricks_service)
+    tool = TableCompareTool(mock_service_with_csv)
     await tool.compare_tables(
         mock_context,
         table1="table1",
@@ -65,10 +81,11 @@ async def test_compare_tables_with_catalogs_schemas(
         schema2="schema2",
     )
 
-    # Verify service was called with correct parameters
-    calls = mock_databricks_service.get_table_data.call_args_list
-    assert calls[0][0] == ("table1", "cat1", "schema1")
-    assert calls[1][0] == ("table2", "cat2", "schema2")
+    # Verify service was called with correct parameters; the two
+    # retrievals run concurrently, so do not assume a call order
+    calls = [call[0] for call in mock_service_with_csv.get_table_data.call_args_list]
+    assert ("table1", "cat1", "schema1") in calls
+    assert ("table2", "cat2", "schema2") in calls
 
 
 @pytest.mark.asyncio
@@ -104,11 +121,14 @@ async def test_quick_compare_tables_success(
     mock_context, mock_databricks_service, sample_table_info
 ):
     """Test successful quick table comparison."""
-    table_info_1 = sample_table_info.copy()
-    table_info_2 = sample_table_info.copy()
-    table_info_2["row_count"] = 1200  # Different row count
+    # The fixture dict is fresh per test; only the variant needs a copy,
+    # built as a single unpacking merge with the delta applied
+    table_info_1 = sample_table_info
+    table_info_2 = {**sample_table_info, "row_count": 1200}  # Different row count
 
-    mock_databricks_service.get_table_info.side_effect = [table_info_1, table_info_2]
+    mock_databricks_service.get_table_info.side_effect = (
+        lambda table, *args: table_info_1 if table == "table1" else table_info_2
+    )
 
     tool = TableCompareTool(mock_databricks_service)
     result = await tool.quick_compare_tables(
@@ -128,17 +148,19 @@ async def test_quick_compare_tables_different_columns(
     mock_context, mock_databricks_service, sample_table_info
 ):
     """Test quick comparison with different columns."""
-    table_info_1 = sample_table_info.copy()
-    table_info_2 = sample_table_info.copy()
-
-    # Modify columns in table_info_2
-    table_info_2["columns"] = [
-        {"col_name": "id", "data_type": "int"},
-        {"col_name": "name", "data_type": "string"},
-        {"col_name": "email", "data_type": "string"},  # Different column
-    ]
-
-    mock_databricks_service.get_table_info.side_effect = [table_info_1, table_info_2]
+    table_info_1 = sample_table_info
+    table_info_2 = {
+        **sample_table_info,
+        "columns": [
+            {"col_name": "id", "data_type": "int"},
+            {"col_name": "name", "data_type": "string"},
+            {"col_name": "email", "data_type": "string"},  # Different column
+        ],
+    }
+
+    mock_databricks_service.get_table_info.side_effect = (
+        lambda table, *args: table_info_1 if table == "table1" else table_info_2
+    )
 
     tool = TableCompareTool(mock_databricks_service)
     result = await tool.quick_compare_tables(
@@ -155,11 +177,11 @@ def test_run_diff_command_identical_files(temp_csv_files):
     """Test diff command with identical files."""
     file1, file2 = temp_csv_files
 
-    tool = TableCompareTool(Mock())
+    tool = TableCompareTool(_DUMMY_SERVICE)
     result = tool._run_diff_command(file1, file2, 5)
 
     assert result["identical"] is True
-    expected_output = "Files are identical (verified through progressive sampling)"
+    expected_output = "Files are identical (verified by full-content comparison)"
     assert result["output"] == expected_output
     assert result["return_code"] == 0
 
@@ -168,7 +190,7 @@ def test_run_diff_command_different_files(temp_different_csv_files):
     """Test diff command with different files."""
     file1, file2 = temp_different_csv_files
 
-    tool = TableCompareTool(Mock())
+    tool = TableCompareTool(_DUMMY_SERVICE)
     result = tool._run_diff_command(file1, file2, 5)
 
     assert result["identical"] is False
@@ -177,31 +199,66 @@ def test_run_diff_command_different_files(temp_different_csv_files):
     assert result["return_code"] == 1
 
 
-@patch("subprocess.run")
-def test_run_diff_command_timeout(mock_subprocess_run):
-    """Test diff command timeout."""
-    from subprocess import TimeoutExpired
+def test_run_diff_command_late_difference(tmp_path):
+    """Test diff command when files differ beyond the sampled prefix."""
+    shared = "".join(f"{i},row,{i * 10}\n" for i in range(600))
+    file1 = tmp_path / "table1.csv"
+    file2 = tmp_path / "table2.csv"
+    file1.write_text("id,name,value\n" + shared)
+    file2.write_text("id,name,value\n" + shared + "600,extra,6000\n")
 
-    mock_subprocess_run.side_effect = TimeoutExpired("diff", 300)
+    tool = TableCompareTool(_DUMMY_SERVICE)
+    result = tool._run_diff_command(str(file1), str(file2), 5)
 
-    tool = TableCompareTool(Mock())
+    assert result["identical"] is False
+    assert "Files differ beyond" in result["output"]
+    assert result["return_code"] == 1
 
-    with pytest.raises(Exception) as exc_info:
-        tool._run_diff_command("file1", "file2", 5)
 
-    assert "timed out" in str(exc_info.value)
+def test_run_diff_command_compressed_identical_files(tmp_path):
+    """Test diff command with gzip-compressed files of equal content."""
+    content = "id,name,value\n1,test,100\n2,example,200\n"
+    file1 = tmp_path / "table1.csv.gz"
+    file2 = tmp_path / "table2.csv.gz"
+    # Different mtime headers make the compressed bytes differ even
+    # though the decoded content is identical
+    with gzip.GzipFile(file1, "wb", mtime=0) as f:
+        f.write(content.encode())
+    with gzip.GzipFile(file2, "wb", mtime=1) as f:
+        f.write(content.encode())
+
+    tool = TableCompareTool(_DUMMY_SERVICE)
+    result = tool._run_diff_command(str(file1), str(file2), 5)
+
+    assert result["identical"] is True
+    assert result["return_code"] == 0
+
+
+def test_run_diff_command_compressed_different_files(tmp_path):
+    """Test diff command with gzip-compressed files that differ."""
+    file1 = tmp_path / "table1.csv.gz"
+    file2 = tmp_path / "table2.csv.gz"
+    with gzip.open(file1, "wt") as f:
+        f.write("id,name,value\n1,test,100\n")
+    with gzip.open(file2, "wt") as f:
+        f.write("id,name,value\n1,test,150\n")
+
+    tool = TableCompareTool(_DUMMY_SERVICE)
+    result = tool._run_diff_command(str(file1), str(file2), 5)
 
+    assert result["identical"] is False
+    assert "100" in result["output"]
+    assert "150" in result["output"]
+    assert result["return_code"] == 1
 
-@patch("subprocess.run")
-def test_run_diff_command_error(mock_subprocess_run):
-    """Test diff command with error."""
-    from subprocess import CalledProcessError
 
-    mock_subprocess_run.side_effect = CalledProcessError(2, "diff", "Error message")
+def test_run_diff_command_missing_file(temp_csv_files):
+    """Test diff command with a missing input file."""
+    file1, _ = temp_csv_files
 
-    tool = TableCompareTool(Mock())
+    tool = TableCompareTool(_DUMMY_SERVICE)
 
     with pytest.raises(Exception) as exc_info:
-        tool._run_diff_command("file1", "file2", 5)
+        tool._run_diff_command(file1, "/nonexistent/file2.csv", 5)
 
-    assert "Diff command failed" in str(exc_info.value)
+    assert "Error running diff" in str(exc_info.value)
@@ -1,7 +1,8 @@
 """Tool for executing Databricks SQL queries."""
 
 import logging
-from typing import Any, Dict, Optional
+import re
+from typing import Any, Dict, List, Optional
 
 from fastmcp import Context
 
@@ -12,8 +13,15 @@ logger = logging.getLogger(__name__)
 
 # Constants
 DEFAULT_QUERY_LIMIT = 1000
-SELECT_KEYWORD = "select"
-LIMIT_KEYWORD = "limit"
+
+# Precompiled per-query checks: a single case-insensitive scan each,
+# instead of lowercasing a copy of the query on every call
+_SELECT_RE = re.compile(r"^\s*SELECT\b", re.IGNORECASE)
+_LIMIT_RE = re.compile(r"\bLIMIT\s+\d+", re.IGNORECASE)
+
+# Shapes of failed responses; copied per error instead of rebuilt
+_ERROR_TEMPLATE = {"success": False, "error": "", "query": ""}
+_INFO_ERROR_TEMPLATE = {"success": False, "error": ""}
 
 
 class QueryTool:
@@ -35,7 +43,8 @@ class QueryTool:
         Args:
             ctx: The FastMCP context
             query: SQL query to execute
-            limit: Maximum number of rows to return (default 1000)
+            limit: Maximum number of rows to return (default 1000;
+                values <= 0 disable the limit)
 
         Returns:
             Dictionary containing query results
@@ -55,9 +64,54 @@ class QueryTool:
             return self._create_success_response(limited_query, result)
 
         except DatabricksServiceError as e:
-            return await self._handle_databricks_error(ctx, e, query)
+            return await self._error_response(ctx, e, query)
         except Exception as e:
-            return await self._handle_unexpected_error(ctx, e, query)
+            return await self._error_response(ctx, e, query, unexpected=True)
+
+    async def execute_query_batch(
+        self,
+        ctx: Context,
+        *,
+        queries: List[str],
+        limit: int = DEFAULT_QUERY_LIMIT,
+    ) -> List[Dict[str, Any]]:
+        """Execute several SQL queries on Databricks in one call.
+
+        Amortizes per-call context reporting across the batch: progress
+        is announced twice in total instead of twice per query. Queries
+        that fail produce an error entry without aborting the rest.
+
+        Args:
+            ctx: The FastMCP context
+            queries: SQL queries to execute in order
+            limit: Maximum number of rows to return per query (default
+                1000; values <= 0 disable the limit)
+
+        Returns:
+            List of result dictionaries, one per query
+        """
+        await ctx.info(f"Executing batch of {len(queries)} Databricks queries")
+
+        responses = []
+        for limited_query in [self._add_limit_if_needed(q, limit) for q in queries]:
+            try:
+                result = self.databricks_service.execute_query(limited_query)
+                responses.append(
+                    self._create_success_response(limited_query, result)
+                )
+            except DatabricksServiceError as e:
+                responses.append(
+                    await self._error_response(ctx, e, limited_query)
+                )
+            except Exception as e:
+                responses.append(
+                    await self._error_response(
+                        ctx, e, limited_query, unexpected=True
+                    )
+                )
+
+        await ctx.info(f"Executed batch of {len(responses)} queries")
+        return responses
 
     def _create_success_response(
         self, query: str, result: Dict[str, Any]
@@ -71,48 +125,35 @@ class QueryTool:
         Returns:
             Formatted success response.
         """
-        return {
-            "success": True,
-            "query": query,
-            "row_count": result["row_count"],
-            "columns": result["columns"],
-            "data": result["data"],
-        }
-
-    async def _handle_databricks_error(
-        self, ctx: Context, error: DatabricksServiceError, query: str
+        # The service result already carries row_count/columns/data, so a
+        # single C-level merge beats re-storing each key individually
+        return {**result, "success": True, "query": query}
+
+    async def _error_response(
+        self, ctx: Context, error: Exception, query: str, unexpected: bool = False
     ) -> Dict[str, Any]:
-        """Handle Databricks service errors.
+        """Report an error and build the failed response.
 
         Args:
             ctx: FastMCP context.
-            error: The Databricks service error.
-            query: Original query.
+            error: The error that occurred.
+            query: Original query (or table name for info lookups).
+            unexpected: Whether the error was not a service error.
 
         Returns:
             Error response dictionary.
         """
         error_msg = str(error)
-        await ctx.error(error_msg)
-        return {"success": False, "error": error_msg, "query": query}
-
-    async def _handle_unexpected_error(
-        self, ctx: Context, error: Exception, query: str
-    ) -> Dict[str, Any]:
-        """Handle unexpected errors.
-
-        Args:
-            ctx: FastMCP context.
-            error: The unexpected error.
-            query: Original query.
+        if unexpected:
+            logger.exception(f"Unexpected error executing query: {error}")
+            await ctx.error(f"Unexpected error executing query: {error}")
+        else:
+            await ctx.error(error_msg)
 
-        Returns:
-            Error response dictionary.
-        """
-        error_msg = f"Unexpected error executing query: {error}"
-        logger.exception(error_msg)
-        await ctx.error(error_msg)
-        return {"success": False, "error": str(error), "query": query}
+        response = _ERROR_TEMPLATE.copy()
+        response["error"] = error_msg
+        response["query"] = query
+        return response
 
     def _add_limit_if_needed(self, query: str, limit: int) -> str:
         """Add LIMIT clause to query if not present.
@@ -124,37 +165,40 @@ class QueryTool:
         Returns:
             Query with LIMIT clause if needed.
         """
-        query_lower = query.lower().strip()
+        # A non-positive limit means "no limit": pass the query through
+        # without any string analysis
+        if limit <= 0:
+            return query
 
-        # Don't add limit if already present or if it's not a SELECT statement
-        if self._has_limit_clause(query_lower) or not self._is_select_query(
-            query_lower
-        ):
+        # Check the constant-time SELECT prefix first so non-SELECT
+        # statements skip the full-query LIMIT scan entirely
+        if not self._is_select_query(query) or self._has_limit_clause(query):
             return query
 
-        return f"{query.rstrip(';')} LIMIT {limit}"
+        trimmed = query.rstrip("; \n\t")
+        return f"{trimmed} LIMIT {limit}"
 
-    def _has_limit_clause(self, query_lower: str) -> bool:
+    def _has_limit_clause(self, query: str) -> bool:
         """Check if query already has a LIMIT clause.
 
         Args:
-            query_lower: Lowercase query string.
+            query: SQL query string.
 
         Returns:
             True if LIMIT clause is present.
         """
-        return LIMIT_KEYWORD in query_lower
+        return _LIMIT_RE.search(query) is not None
 
-    def _is_select_query(self, query_lower: str) -> bool:
+    def _is_select_query(self, query: str) -> bool:
         """Check if query is a SELECT statement.
 
         Args:
-            query_lower: Lowercase query string.
+            query: SQL query string.
 
         Returns:
             True if query is a SELECT statement.
         """
-        return query_lower.startswith(SELECT_KEYWORD)
+        return _SELECT_RE.match(query) is not None
 
     async def get_table_info(
         self,
@@ -187,7 +231,7 @@ class QueryTool:
             return {"success": True, "table_info": table_info}
 
         except DatabricksServiceError as e:
-            return await self._handle_databricks_error(ctx, e, table_name)
+            return await self._error_response(ctx, e, table_name)
         except Exception as e:
             return await self._handle_table_info_error(ctx, e)
 
@@ -206,4 +250,7 @@ class QueryTool:
         error_msg = f"Unexpected error getting table info: {error}"
         logger.exception(error_msg)
         await ctx.error(error_msg)
-        return {"success": False, "error": str(error)}
+
+        response = _INFO_ERROR_TEMPLATE.copy()
+        response["error"] = str(error)
+        return response
@@ -1,10 +1,15 @@
 """Tool for comparing two Databricks tables."""
 
+import asyncio
+import difflib
+import filecmp
+import io
 import logging
 import os
-import subprocess
+from itertools import islice
 from typing import Any, Dict, List, Optional, Tuple
 
+import pyarrow as pa
 from fastmcp import Context
 
 from ..services.databricks_service import (DatabricksService,
@@ -15,15 +20,20 @@ logger = logging.getLogger(__name__)
 # Constants
 DEFAULT_DIFF_LINES = 10
 MAX_DIFF_OUTPUT_LINES = 10  # Maximum lines to show in diff output
-DIFF_TIMEOUT_SECONDS = 300  # 5 minutes
 DIFF_SUCCESS_CODE = 0
 DIFF_DIFFERENT_CODE = 1
-UNIFIED_DIFF_FORMAT = "-u"
 
 # Smart diff strategy constants
-INITIAL_SAMPLE_SIZE = 5
 INCREMENTAL_SAMPLE_SIZES = [5, 25, 100, 500]  # Progressive sample sizes
-MAX_SAMPLE_SIZE = 1000
+
+# Suffixes DatabricksService appends when csv_compression is enabled
+COMPRESSED_CSV_EXTENSIONS = (".gz", ".zst")
+IDENTITY_COMPARE_CHUNK_SIZE = 1024 * 1024  # Bytes per decompressed compare chunk
+
+# Built once; every part of the truncation message is constant
+_TRUNCATION_SUFFIX = (
+    f"\n... (truncated, showing first {MAX_DIFF_OUTPUT_LINES} diff lines)"
+)
 
 
 class TableCompareTool:
@@ -74,11 +84,18 @@ class TableCompareTool:
 
             # Run diff comparison
             await ctx.info("Running diff comparison...")
-            diff_result = self._run_diff_command(csv_path1, csv_path2, diff_lines)
-
-            # Get additional file information
+            # Stat the files once up front; the sizes feed both the
+            # result payload and the diff's size-mismatch early-out
             file_info = self._get_file_comparison_info(csv_path1, csv_path2)
 
+            diff_result = self._run_diff_command(
+                csv_path1,
+                csv_path2,
+                diff_lines,
+                size1=file_info["size1"],
+                size2=file_info["size2"],
+            )
+
             await ctx.info("Table comparison completed")
 
             return self._create_comparison_result(
@@ -114,11 +131,18 @@ class TableCompareTool:
         Returns:
             Tuple of (csv_path1, csv_path2).
         """
-        await ctx.info("Retrieving data from first table...")
-        csv_path1 = self.databricks_service.get_table_data(table1, catalog1, schema1)
-
-        await ctx.info("Retrieving data from second table...")
-        csv_path2 = self.databricks_service.get_table_data(table2, catalog2, schema2)
+        await ctx.info("Retrieving data from both tables...")
+
+        # The two downloads are independent network-bound calls, so
+        # overlapping them roughly halves the retrieval wall time
+        csv_path1, csv_path2 = await asyncio.gather(
+            asyncio.to_thread(
+                self.databricks_service.get_table_data, table1, catalog1, schema1
+            ),
+            asyncio.to_thread(
+                self.databricks_service.get_table_data, table2, catalog2, schema2
+            ),
+        )
 
         return csv_path1, csv_path2
 
@@ -134,9 +158,11 @@ class TableCompareTool:
         Returns:
             Dictionary with file size information.
         """
+        stat1 = os.stat(csv_path1)
+        stat2 = os.stat(csv_path2)
         return {
-            "size1": os.path.getsize(csv_path1),
-            "size2": os.path.getsize(csv_path2),
+            "size1": stat1.st_size,
+            "size2": stat2.st_size,
         }
 
     def _create_comparison_result(
@@ -208,9 +234,14 @@ class TableCompareTool:
         return {"success": False, "error": str(error)}
 
     def _run_diff_command(
-        self, file1: str, file2: str, context_lines: int
+        self,
+        file1: str,
+        file2: str,
+        context_lines: int,
+        size1: Optional[int] = None,
+        size2: Optional[int] = None,
     ) -> Dict[str, Any]:
-        """Run smart diff command to compare two CSV files.
+        """Run a smart diff comparing two CSV files.
 
         Uses progressive sampling strategy: starts with small samples and increases
         if no differences found, but limits output to MAX_DIFF_OUTPUT_LINES.
@@ -219,223 +250,183 @@ class TableCompareTool:
             file1: Path to first CSV file
             file2: Path to second CSV file
             context_lines: Number of context lines for diff (max applied)
+            size1: Known size of file1 in bytes, if already stat'd
+            size2: Known size of file2 in bytes, if already stat'd
 
         Returns:
             Dictionary containing diff results
 
         Raises:
-            Exception: If diff command fails or times out.
+            Exception: If the diff comparison fails.
         """
         try:
+            # Identical files are the common case; a buffered content
+            # compare settles it without any sampling and, unlike
+            # hashing, bails on the first differing block. Known
+            # differing sizes prove inequality without reading a byte,
+            # but only for plain files — compressed sizes (and bytes)
+            # can differ even when the decoded content is identical
+            compressed = self._is_compressed(file1) or self._is_compressed(file2)
+            maybe_identical = compressed or size1 is None or size1 == size2
+            if maybe_identical and self._files_identical(file1, file2):
+                return {
+                    "command": f"content compare {file1} {file2}",
+                    "output": "Files are identical (verified by full-content comparison)",
+                    "identical": True,
+                    "return_code": DIFF_SUCCESS_CODE,
+                }
+
             # Limit context lines to maximum
             actual_context_lines = min(context_lines, MAX_DIFF_OUTPUT_LINES)
 
             # Try smart diff with progressive sampling
             return self._smart_diff_with_sampling(file1, file2, actual_context_lines)
 
-        except subprocess.TimeoutExpired:
-            raise Exception(
-                f"Diff command timed out after {DIFF_TIMEOUT_SECONDS // 60} minutes"
-            )
-        except subprocess.CalledProcessError as e:
-            raise Exception(f"Diff command failed: {e}")
         except Exception as e:
             raise Exception(f"Error running diff: {e}")
 
-    def _smart_diff_with_sampling(
-        self, file1: str, file2: str, context_lines: int
-    ) -> Dict[str, Any]:
-        """Perform smart diff using progressive sampling strategy.
+    @staticmethod
+    def _is_compressed(path: str) -> bool:
+        """Check whether a CSV path carries a compression suffix.
 
         Args:
-            file1: Path to first CSV file.
-            file2: Path to second CSV file.
-            context_lines: Number of context lines for diff.
+            path: Path to a CSV file.
 
         Returns:
-            Dictionary containing diff results.
+            True if the file was written through a compression codec.
         """
-        for sample_size in INCREMENTAL_SAMPLE_SIZES:
-            logger.debug(f"Trying diff with sample size: {sample_size}")
-
-            # Create temporary sample files
-            sample_file1 = self._create_sample_file(
-                file1, sample_size, suffix="_1"
-            )
-            sample_file2 = self._create_sample_file(
-                file2, sample_size, suffix="_2"
-            )
+        return path.endswith(COMPRESSED_CSV_EXTENSIONS)
 
-            try:
-                # Run diff on samples
-                cmd = self._build_diff_command(
-                    sample_file1, sample_file2, context_lines
-                )
-                result = self._execute_diff_command(cmd)
-
-                # If files are different, return the result
-                if result.returncode == DIFF_DIFFERENT_CODE:
-                    diff_result = self._process_diff_result(cmd, result)
-                    # Update command to show original files for user clarity
-                    command_text = f"diff (sample {sample_size} lines) {file1} {file2}"
-                    diff_result["command"] = command_text
-                    diff_result["sample_size"] = sample_size
-                    return diff_result
-                elif result.returncode != DIFF_SUCCESS_CODE:
-                    # Error case - process and return
-                    return self._process_diff_result(cmd, result)
-
-                # Files are identical for this sample size, try larger sample
-                logger.debug(f"No differences found in {sample_size} line sample")
-
-            finally:
-                # Clean up temporary sample files
-                self._cleanup_sample_files(sample_file1, sample_file2)
-
-        # If we've tried all sample sizes and found no differences,
-        # the files are likely identical
-        max_sample = INCREMENTAL_SAMPLE_SIZES[-1]
-        return {
-            "command": f"diff (smart sampling up to {max_sample} lines)",
-            "output": "Files are identical (verified through progressive sampling)",
-            "identical": True,
-            "return_code": DIFF_SUCCESS_CODE,
-            "sample_size": INCREMENTAL_SAMPLE_SIZES[-1]
-        }
+    @staticmethod
+    def _open_csv_text(path: str) -> io.TextIOBase:
+        """Open a CSV for line reading, decoding any compression codec.
 
-    def _create_sample_file(
-        self, original_file: str, sample_size: int, suffix: str = ""
-    ) -> str:
-        """Create a temporary file with first N lines of the original file.
+        The service writes .gz/.zst files when csv_compression is
+        configured; pyarrow picks the matching codec from the suffix.
 
         Args:
-            original_file: Path to original file.
-            sample_size: Number of lines to include.
-            suffix: Suffix for temp file name.
+            path: Path to a plain or compressed CSV file.
 
         Returns:
-            Path to temporary sample file.
-        """
-        # Create temporary file in same directory as original
-        temp_dir = os.path.dirname(original_file)
-        base_name = os.path.basename(original_file)
-        temp_file = os.path.join(
-            temp_dir, f"sample_{sample_size}{suffix}_{base_name}"
-        )
-
-        # Use head command to get first N lines
-        cmd = ["head", "-n", str(sample_size), original_file]
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
-
-        if result.returncode != 0:
-            raise Exception(f"Failed to create sample file: {result.stderr}")
-
-        # Write sample to temporary file
-        with open(temp_file, 'w') as f:
-            f.write(result.stdout)
-
-        return temp_file
-
-    def _cleanup_sample_files(self, *file_paths: str) -> None:
-        """Clean up temporary sample files.
-
-        Args:
-            file_paths: Paths to files to remove.
+            A text-mode file object yielding decoded CSV lines.
         """
-        for file_path in file_paths:
-            try:
-                if os.path.exists(file_path):
-                    os.remove(file_path)
-            except OSError as e:
-                logger.warning(f"Failed to remove sample file {file_path}: {e}")
-
-    def _build_diff_command(
-        self, file1: str, file2: str, context_lines: int
-    ) -> List[str]:
-        """Build the diff command with parameters.
+        if not path.endswith(COMPRESSED_CSV_EXTENSIONS):
+            return open(path)
+        return io.TextIOWrapper(pa.input_stream(path, compression="detect"))
 
-        Args:
-            file1: Path to first file.
-            file2: Path to second file.
-            context_lines: Number of context lines.
+    def _files_identical(self, file1: str, file2: str) -> bool:
+        """Compare two CSV files for content equality.
 
-        Returns:
-            Command as list of strings.
-        """
-        return ["diff", f"{UNIFIED_DIFF_FORMAT}{context_lines}", file1, file2]
-
-    def _execute_diff_command(self, cmd: List[str]) -> subprocess.CompletedProcess:
-        """Execute the diff command.
+        Plain files use filecmp's buffered byte compare. Compressed
+        files are compared on their decoded streams, since codecs do not
+        guarantee byte-identical output for identical content.
 
         Args:
-            cmd: Command to execute.
+            file1: Path to first CSV file.
+            file2: Path to second CSV file.
 
         Returns:
-            Completed process result.
+            True if both files hold the same (decoded) content.
         """
-        return subprocess.run(
-            cmd, capture_output=True, text=True, timeout=DIFF_TIMEOUT_SECONDS
-        )
+        if not (self._is_compressed(file1) or self._is_compressed(file2)):
+            return filecmp.cmp(file1, file2, shallow=False)
+
+        with pa.input_stream(file1, compression="detect") as s1, pa.input_stream(
+            file2, compression="detect"
+        ) as s2:
+            buf1 = b""
+            buf2 = b""
+            while True:
+                if not buf1:
+                    buf1 = s1.read(IDENTITY_COMPARE_CHUNK_SIZE)
+                if not buf2:
+                    buf2 = s2.read(IDENTITY_COMPARE_CHUNK_SIZE)
+                if not buf1 or not buf2:
+                    return not buf1 and not buf2
+
+                # Reads may return different lengths; compare the
+                # overlapping span and carry the remainder forward
+                span = min(len(buf1), len(buf2))
+                if buf1[:span] != buf2[:span]:
+                    return False
+                buf1 = buf1[span:]
+                buf2 = buf2[span:]
 
-    def _process_diff_result(
-        self, cmd: List[str], result: subprocess.CompletedProcess
+    def _smart_diff_with_sampling(
+        self, file1: str, file2: str, context_lines: int
     ) -> Dict[str, Any]:
-        """Process the diff command result.
+        """Perform smart diff using progressive sampling strategy.
 
-        Args:
-            cmd: Original command.
-            result: Process result.
-
-        Returns:
-            Processed diff result.
-        """
-        if result.returncode == DIFF_SUCCESS_CODE:
-            return {
-                "command": " ".join(cmd),
-                "output": "Files are identical",
-                "identical": True,
-                "return_code": result.returncode,
-            }
-        elif result.returncode == DIFF_DIFFERENT_CODE:
-            # Limit the output to MAX_DIFF_OUTPUT_LINES
-            limited_output = self._limit_diff_output(result.stdout)
-            return {
-                "command": " ".join(cmd),
-                "output": limited_output,
-                "identical": False,
-                "return_code": result.returncode,
-            }
-        else:
-            # Error occurred
-            error_msg = result.stderr or "Unknown diff error"
-            raise subprocess.CalledProcessError(result.returncode, cmd, error_msg)
-
-    def _limit_diff_output(self, diff_output: str) -> str:
-        """Limit diff output to maximum number of lines.
+        Streams the first N lines of each file and compares them
+        in-process with difflib, instead of forking head and diff
+        subprocesses and round-tripping samples through temp files.
 
         Args:
-            diff_output: Original diff output.
+            file1: Path to first CSV file.
+            file2: Path to second CSV file.
+            context_lines: Number of context lines for diff.
 
         Returns:
-            Limited diff output with truncation message if needed.
+            Dictionary containing diff results.
         """
-        lines = diff_output.split('\n')
-
-        if len(lines) <= MAX_DIFF_OUTPUT_LINES:
-            return diff_output
-
-        # Take first MAX_DIFF_OUTPUT_LINES and add truncation message
-        limited_lines = lines[:MAX_DIFF_OUTPUT_LINES]
-        total_lines = len(lines)
-        truncated_count = total_lines - MAX_DIFF_OUTPUT_LINES
-
-        truncation_msg = (
-            f"\n... (truncated {truncated_count} more lines, "
-            f"showing first {MAX_DIFF_OUTPUT_LINES} lines)"
-        )
-        limited_lines.append(truncation_msg)
-
-        return '\n'.join(limited_lines)
+        with self._open_csv_text(file1) as f1, self._open_csv_text(file2) as f2:
+            lines1: List[str] = []
+            lines2: List[str] = []
+
+            for sample_size in INCREMENTAL_SAMPLE_SIZES:
+                logger.debug("Trying diff with sample size: %s", sample_size)
+
+                # Grow the buffers by just the delta since the previous
+                # sample size; the shared prefix is never re-read
+                lines1.extend(islice(f1, sample_size - len(lines1)))
+                lines2.extend(islice(f2, sample_size - len(lines2)))
+
+                # Equal prefixes need no diff computation; try a larger sample
+                if lines1 == lines2:
+                    logger.debug(
+                        "No differences found in %s line sample", sample_size
+                    )
+                    continue
+
+                # Pull at most one line past the cap straight off the
+                # generator; the rest of the diff is never computed
+                diff_lines = list(
+                    islice(
+                        difflib.unified_diff(
+                            lines1,
+                            lines2,
+                            fromfile=file1,
+                            tofile=file2,
+                            n=context_lines,
+                        ),
+                        MAX_DIFF_OUTPUT_LINES + 1,
+                    )
+                )
+                diff_output = "".join(diff_lines[:MAX_DIFF_OUTPUT_LINES])
+                if len(diff_lines) > MAX_DIFF_OUTPUT_LINES:
+                    diff_output += _TRUNCATION_SUFFIX
+                return {
+                    "command": f"diff (sample {sample_size} lines) {file1} {file2}",
+                    "output": diff_output,
+                    "identical": False,
+                    "return_code": DIFF_DIFFERENT_CODE,
+                    "sample_size": sample_size,
+                }
+
+        # Sampling only runs after the full-content compare has proven
+        # the files differ, so an equal sampled prefix just means the
+        # difference lies beyond it
+        max_sample = INCREMENTAL_SAMPLE_SIZES[-1]
+        return {
+            "command": f"diff (smart sampling up to {max_sample} lines)",
+            "output": (
+                f"Files differ beyond the first {max_sample} lines "
+                "(sampled prefixes are identical)"
+            ),
+            "identical": False,
+            "return_code": DIFF_DIFFERENT_CODE,
+            "sample_size": max_sample,
+        }
 
     async def quick_compare_tables(
         self,
@@ -509,8 +500,14 @@ class TableCompareTool:
         Returns:
             Tuple of (info1, info2).
         """
-        info1 = self.databricks_service.get_table_info(table1, catalog1, schema1)
-        info2 = self.databricks_service.get_table_info(table2, catalog2, schema2)
+        info1, info2 = await asyncio.gather(
+            asyncio.to_thread(
+                self.databricks_service.get_table_info, table1, catalog1, schema1
+            ),
+            asyncio.to_thread(
+                self.databricks_service.get_table_info, table2, catalog2, schema2
+            ),
+        )
         return info1, info2
 
     def _calculate_comparison_metrics(
@@ -538,15 +535,35 @@ class TableCompareTool:
             cols2: Columns from second table.
 
         Returns:
-            Column comparison results.
+            Column comparison results, with missing-column lists in
+            sorted order.
         """
-        col_names1 = {col["col_name"] for col in cols1}
-        col_names2 = {col["col_name"] for col in cols2}
+        # Sorted-merge walk produces both missing lists in a single pass
+        # with deterministic ordering, instead of building two sets and
+        # two symmetric differences in hash order
+        names1 = sorted(col["col_name"] for col in cols1)
+        names2 = sorted(col["col_name"] for col in cols2)
+
+        only1: List[str] = []
+        only2: List[str] = []
+        i = j = 0
+        while i < len(names1) and j < len(names2):
+            if names1[i] == names2[j]:
+                i += 1
+                j += 1
+            elif names1[i] < names2[j]:
+                only1.append(names1[i])
+                i += 1
+            else:
+                only2.append(names2[j])
+                j += 1
+        only1.extend(names1[i:])
+        only2.extend(names2[j:])
 
         return {
-            "columns_match": col_names1 == col_names2,
-            "columns_missing_in_table2": list(col_names1 - col_names2),
-            "columns_missing_in_table1": list(col_names2 - col_names1),
+            "columns_match": not only1 and not only2,
+            "columns_missing_in_table2": only1,
+            "columns_missing_in_table1": only2,
         }
 
     def _create_quick_comparison_result(